@@ -56,7 +56,7 @@ class Client:
             self._install_signal(debug_signal)
 
     def _dump_state(self, signum: int, frame: Optional["FrameType"]) -> None:
-        logger.warning(f"Dumping Internal State signal={signum} and frame={frame}")
+        logger.warning("Dumping Internal State signal=%s and frame=%s", signum, frame)
 
     def _install_signal(self, debug_signal: Union["signal.Signals", str, int]) -> None:
         debug_signal = debug_signal
@@ -75,7 +75,7 @@ class Client:
                     f"debug signal is not valid signal={debug_signal}.  Please use signal.SIG*"
                 )
 
-        logger.debug(f" adding debug handler at signal={signal!r} for pid={getpid()}")
+        logger.debug(" adding debug handler at signal=%r for pid=%s", signal, getpid())
         signal.signal(debug_signal, self._dump_state)
         # loop = asyncio.get_event_loop()
         # loop.add_signal_handler(signal, self._dump_state)
@@ -126,7 +126,7 @@ class Client:
         if paging_state not in self._paged:
             raise InternalDriverError(f"unknown paging_state={paging_state!r}")
         request_handler, params = self._paged.pop(paging_state)
-        logger.debug(f" have request_handler={request_handler} and params={params}")
+        logger.debug(" have request_handler=%s and params=%s", request_handler, params)
         params["paging_state"] = paging_state
         resp = await self._conn.make_call(
             request_handler, self._conn.protocol.build_response, params=params,
@@ -144,7 +144,7 @@ class Client:
         page_size: Optional[int] = None,
         consistency: "Consistency" = Consistency.ONE,
     ) -> "ExpectedResponses":
-        logger.debug(f" in execte got args={args}")
+        logger.debug(" in execte got args=%s", args)
         if isinstance(stmt, str):
             # query
             params: Dict[str, Any] = {
@@ -187,7 +187,10 @@ class Client:
     ) -> None:
         result.page_ = self.page_
         logger.debug(
-            f" storing request_handler={request_handler} and params={params} for paging_state={result.paging_state!r}"
+            " storing request_handler=%s and params=%s for paging_state=%r",
+            request_handler,
+            params,
+            result.paging_state,
         )
         assert result.paging_state is not None
         self._paged[result.paging_state] = (request_handler, params)
@@ -1,12 +1,11 @@
 import ipaddress
 from enum import Enum
-from struct import Struct, pack, unpack
-from sys import byteorder
-from typing import Dict, List, Optional, Union
+from struct import Struct
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from .constants import Consistency
-from .core import SBytes
-from .exceptions import InternalDriverError
+from .core import SBytes, pretty_type, value_map
+from .exceptions import BadInputException, InternalDriverError
 from .types import ExpectedType  # noqa: F401
 from .types import InetType
 from .utils import get_logger
@@ -79,6 +78,7 @@ class STypes(str, Enum):
     SHORT = "h"
     USHORT = "H"
     BYTE = "B"
+    SBYTE = "b"
     CHAR = "s"
     FLOAT = "f"
     DOUBLE = "d"
@@ -91,11 +91,11 @@ def get_struct(fmt: str) -> Struct:
     global structs
     if len(structs) == 0:
         formats = [
-            f"{NETWORK_ORDER}{STypes.USHORT}",
-            f"{NETWORK_ORDER}{STypes.INT}",
-            f"{NETWORK_ORDER}{STypes.BYTE}",
-            f"{NETWORK_ORDER}{STypes.BYTE}{STypes.BYTE}{STypes.SHORT}{STypes.BYTE}{STypes.INT}",
-            f"{NETWORK_ORDER}{STypes.USHORT}{STypes.BYTE}",
+            f"{NETWORK_ORDER}{STypes.USHORT.value}",
+            f"{NETWORK_ORDER}{STypes.INT.value}",
+            f"{NETWORK_ORDER}{STypes.BYTE.value}",
+            f"{NETWORK_ORDER}{STypes.BYTE.value}{STypes.BYTE.value}{STypes.SHORT.value}{STypes.BYTE.value}{STypes.INT.value}",
+            f"{NETWORK_ORDER}{STypes.USHORT.value}{STypes.BYTE.value}",
         ]
         for frmt in formats:
             structs[frmt] = Struct(frmt)
@@ -104,15 +104,27 @@ def get_struct(fmt: str) -> Struct:
     return structs[fmt]
 
 
+# the fixed formats used on every message, bound once at import
+_USHORT = Struct(f"{NETWORK_ORDER}{STypes.USHORT.value}")
+_PACK_USHORT = _USHORT.pack
+_INT = Struct(f"{NETWORK_ORDER}{STypes.INT.value}")
+_PACK_INT = _INT.pack
+_INT_INT = Struct(f"{NETWORK_ORDER}{STypes.INT.value}{STypes.INT.value}")
+_PACK_LEN_INT = _INT_INT.pack
+_BYTE = Struct(f"{NETWORK_ORDER}{STypes.BYTE.value}")
+# a null [value] is just a negative length
+_NULL_VALUE = _PACK_INT(-1)
+_CONSISTENCIES = value_map(Consistency)
+
 # encoders
 
 
 def encode_short(value: int) -> bytes:
-    return get_struct(f"{NETWORK_ORDER}{STypes.USHORT}").pack(value)
+    return _PACK_USHORT(value)
 
 
 def encode_int(value: int) -> bytes:
-    return get_struct(f"{NETWORK_ORDER}{STypes.INT}").pack(value)
+    return _PACK_INT(value)
 
 
 def encode_string(value: Union[str, bytes]) -> bytes:
@@ -120,16 +132,11 @@ def encode_string(value: Union[str, bytes]) -> bytes:
         value_bytes = value
     else:
         value_bytes = value.encode("utf-8")
-    return encode_short(len(value_bytes)) + pack(
-        f"{NETWORK_ORDER}{len(value_bytes)}{STypes.CHAR}", value_bytes
-    )
+    return _PACK_USHORT(len(value_bytes)) + value_bytes
 
 
 def encode_bytes(value: Union[bytes]) -> bytes:
-    value_bytes = value
-    return encode_int(len(value_bytes)) + pack(
-        f"{NETWORK_ORDER}{len(value_bytes)}{STypes.CHAR}", value_bytes
-    )
+    return _PACK_INT(len(value)) + value
 
 
 # https://stackoverflow.com/questions/21017698/converting-int-to-bytes-in-python-3/54141411#54141411
@@ -138,17 +145,52 @@ def encode_varint(value: int) -> bytes:
     return value.to_bytes(length, byteorder="big", signed=True)
 
 
-def encode_value(value: Optional[Union[str, bytes, int]]) -> bytes:
+def _encode_int_value(value: int) -> bytes:
+    # an int is always 4 bytes, so pack the length with it
+    return _PACK_LEN_INT(4, value)
+
+
+def _encode_str_value(value: str) -> bytes:
+    value_bytes = value.encode("utf-8")
+    return _PACK_INT(len(value_bytes)) + value_bytes
+
+
+def _encode_bytes_value(value: Union[bytes, bytearray]) -> bytes:
+    return _PACK_INT(len(value)) + value
+
+
+def _encode_memoryview_value(value: memoryview) -> bytes:
+    # the length is in bytes, not items, and the view is copied only once
+    if not value.contiguous:
+        raise BadInputException(
+            f"expected a contiguous memoryview but got value={value!r}"
+        )
+    return _PACK_INT(value.nbytes) + value
+
+
+# looked up by exact type first, subclasses (bool, enums) are matched in order
+_VALUE_ENCODERS: Dict[type, Callable[[Any], bytes]] = {
+    int: _encode_int_value,
+    str: _encode_str_value,
+    bytes: _encode_bytes_value,
+    bytearray: _encode_bytes_value,
+    memoryview: _encode_memoryview_value,
+}
+
+
+def encode_value(
+    value: Optional[Union[str, bytes, bytearray, memoryview, int]]
+) -> bytes:
     if value is None:
-        return encode_int(-1)
-    if isinstance(value, int):
-        value_bytes = encode_int(value)
-    elif isinstance(value, str):
-        value_bytes = value.encode("utf-8")
-    elif isinstance(value, bytes):
-        value_bytes = value
-    return encode_int(len(value_bytes)) + pack(
-        f"{NETWORK_ORDER}{len(value_bytes)}{STypes.CHAR}", value_bytes
+        return _NULL_VALUE
+    encoder = _VALUE_ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    for value_type, encoder in _VALUE_ENCODERS.items():
+        if isinstance(value, value_type):
+            return encoder(value)
+    raise BadInputException(
+        f"expected type=int/str/bytes/bytearray/memoryview but got type={pretty_type(value)} for value={value!r}"
     )
 
 
@@ -157,41 +199,38 @@ def encode_long_string(value: Union[str, bytes]) -> bytes:
         value_bytes = value
     else:
         value_bytes = value.encode("utf-8")
-    return encode_int(len(value_bytes)) + pack(
-        f"{NETWORK_ORDER}{len(value_bytes)}{STypes.CHAR}", value_bytes
-    )
+    return _PACK_INT(len(value_bytes)) + value_bytes
 
 
-def encode_strings_list(values: List[str]) -> bytes:
-    data = encode_short(len(values))
-    for value in values:
-        data += encode_string(value)
-    return data
+def encode_strings_list(values: Sequence[str]) -> bytes:
+    parts = [_PACK_USHORT(len(values))]
+    parts.extend([encode_string(value) for value in values])
+    return b"".join(parts)
 
 
 # decoders
 
 
 def decode_short(sbytes: "SBytes") -> int:
-    return unpack(f"{NETWORK_ORDER}{STypes.USHORT}", sbytes.grab(2))[0]
+    return sbytes.unpack(_USHORT)[0]
 
 
 def decode_int(sbytes: "SBytes") -> int:
-    return unpack(f"{NETWORK_ORDER}{STypes.INT}", sbytes.grab(4))[0]
+    return sbytes.unpack(_INT)[0]
 
 
 def decode_short_bytes(sbytes: "SBytes") -> bytes:
     length = decode_short(sbytes)
     if length == 0:
         return b""
-    return unpack(f"{NETWORK_ORDER}{length}{STypes.CHAR}", sbytes.grab(length))[0]
+    return sbytes.grab(length)
 
 
 def decode_length_bytes(sbytes: "SBytes", length: int) -> bytes:
     assert length is not None
     if length == 0:
         return b""
-    return unpack(f"{NETWORK_ORDER}{length}{STypes.CHAR}", sbytes.grab(length))[0]
+    return sbytes.grab(length)
 
 
 def decode_int_bytes_must(sbytes: "SBytes") -> bytes:
@@ -200,7 +239,7 @@ def decode_int_bytes_must(sbytes: "SBytes") -> bytes:
         return b""
     elif length < 0:
         raise InternalDriverError(f"unexpected negative length")
-    return unpack(f"{NETWORK_ORDER}{length}{STypes.CHAR}", sbytes.grab(length))[0]
+    return sbytes.grab(length)
 
 
 def decode_int_bytes(sbytes: "SBytes") -> Optional[bytes]:
@@ -209,31 +248,35 @@ def decode_int_bytes(sbytes: "SBytes") -> Optional[bytes]:
         return b""
     elif length < 0:
         return None
-    return unpack(f"{NETWORK_ORDER}{length}{STypes.CHAR}", sbytes.grab(length))[0]
+    return sbytes.grab(length)
 
 
 def decode_consistency(sbytes: "SBytes") -> "Consistency":
-    code = decode_short(sbytes)
-    try:
-        return Consistency(code)
-    except ValueError:
+    return consistency_from_code(decode_short(sbytes))
+
+
+def consistency_from_code(code: int) -> "Consistency":
+    # for consistencies read as part of a larger fixed width field
+    consistency = _CONSISTENCIES.get(code)
+    if consistency is None:
         raise InternalDriverError(f"unknown consistency={code:x}")
+    return consistency
 
 
 def decode_byte(sbytes: "SBytes") -> int:
-    return get_struct(f"{NETWORK_ORDER}{STypes.BYTE}").unpack(sbytes.grab(1))[0]
+    return sbytes.unpack(_BYTE)[0]
 
 
 def decode_inet(sbytes: "SBytes") -> "InetType":
     length = decode_byte(sbytes)
     if length not in (4, 16):
         raise InternalDriverError(f"unhandled inet length={length}")
-    address = decode_length_bytes(sbytes, length)
-    intaddress = int.from_bytes(address, byteorder=byteorder)
+    # the address is in network order, which the constructors take as is
+    address = sbytes.grab(length)
     ipaddr = (
-        ipaddress.IPv4Address(intaddress)
+        ipaddress.IPv4Address(address)
         if length == 4
-        else ipaddress.IPv6Address(intaddress)
+        else ipaddress.IPv6Address(address)
     )
     port = decode_int(sbytes)
     assert isinstance(ipaddr, ipaddress.IPv4Address) or isinstance(
@@ -247,20 +290,16 @@ def decode_string(sbytes: "SBytes") -> str:
 
 
 def decode_strings_list(sbytes: "SBytes") -> List[str]:
-    string_list = []
     num_strings = decode_short(sbytes)
-    for _cnt in range(num_strings):
-        string_list.append(decode_string(sbytes))
-    return string_list
+    return [decode_string(sbytes) for _cnt in range(num_strings)]
 
 
 def decode_string_multimap(sbytes: "SBytes") -> Dict[str, List[str]]:
     num_entries = decode_short(sbytes)
-    multimap: Dict[str, List[str]] = {}
-    for _cnt in range(num_entries):
-        logger.debug(f"multimap num_entries={num_entries}")
-        key = decode_string(sbytes)
-        values = decode_strings_list(sbytes)
-        multimap[key] = values
-    logger.debug("end multimap")
-    return multimap
+    logger.debug("multimap num_entries=%s", num_entries)
+    # a dict comprehension reads the value before the key before python 3.8,
+    # so build from (key, value) pairs to keep the wire order
+    return dict(
+        (decode_string(sbytes), decode_strings_list(sbytes))
+        for _cnt in range(num_entries)
+    )
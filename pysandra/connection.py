@@ -55,7 +55,7 @@ class Connection:
 
     @property
     def is_connected(self) -> bool:
-        logger.debug(f"is_connected={self._is_connected}")
+        logger.debug("is_connected=%s", self._is_connected)
         return self._is_connected
 
     @property
@@ -68,7 +68,7 @@ class Connection:
         response_handler: Callable,
         params: Dict[str, Any] = None,
     ) -> "ExpectedResponses":
-        logger.debug(f" sending {request_handler}")
+        logger.debug(" sending %s", request_handler)
         assert self._dispatcher is not None
         event = await self._dispatcher.send(
             request_handler, response_handler, params=params
@@ -87,19 +87,19 @@ class Connection:
                 await self._dispatcher.cycle()
         except asyncio.IncompleteReadError as e:
             exp = ConnectionDroppedError(e)
-            logger.warning(f" connection dropped, going to close")
+            logger.warning(" connection dropped, going to close")
             await self._dispatcher.end_all(exp)
         except ConnectionResetError as e:
             exp = ConnectionDroppedError(e)
-            logger.warning(f" connection dropped, going to close")
+            logger.warning(" connection dropped, going to close")
             await self._dispatcher.end_all(exp)
         except asyncio.CancelledError:
-            logger.debug(f"got CanceledError")
+            logger.debug("got CanceledError")
             await self.close(True)
             # raise (e)
         # do I know what I'm doing?
         except BaseException:
-            logger.warning(f"got baseeception")
+            logger.warning("got baseeception")
             traceback.print_exc(file=sys.stdout)
 
     async def startup(self) -> bool:
@@ -118,11 +118,11 @@ class Connection:
         )
         assert isinstance(supported_options, dict)
         self.make_choices(supported_options)
-        logger.debug(f" sending Startup options={self.options}")
+        logger.debug(" sending Startup options=%s", self.options)
         params = {"options": self.options}
         # READY may be compressed
         if "COMPRESSION" in self.options:
-            logger.debug(f"setting dec2omress to algo={self.decompress}")
+            logger.debug("setting dec2omress to algo=%s", self.decompress)
             self._dispatcher.decompress = self._decompress
             self.protocol.compress = self._compress
         is_ready = await self.make_call(
@@ -130,7 +130,7 @@ class Connection:
         )
         assert isinstance(is_ready, bool) and is_ready
         self._is_ready = is_ready
-        logger.debug(f"startup is_ready={is_ready}")
+        logger.debug("startup is_ready=%s", is_ready)
         return is_ready
 
     async def close(self, from_listener: bool = False) -> None:
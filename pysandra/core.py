@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, cast
+from struct import Struct
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, cast
 
 from .exceptions import InternalDriverError, MaximumStreamsException
 from .utils import get_logger
@@ -18,6 +19,14 @@ class HexEnum(int, Enum):
         return f"<{self.__class__.__name__}.{self._name_}: {hex(self)}>"
 
 
+E = TypeVar("E", bound=Enum)
+
+
+def value_map(enum: Type[E]) -> Dict[Any, E]:
+    # value -> member lookup for decoding, a dict hit is cheaper than calling the Enum
+    return {member.value: member for member in enum}
+
+
 def pretty_type(value: Any) -> str:
     if type(value) == str:
         return "str"
@@ -45,6 +54,28 @@ class SBytes(bytes):
         self._index += count
         return self[curindex : curindex + count]
 
+    def unpack(self, fixed: Struct) -> Tuple[Any, ...]:
+        # read a fixed width field in place rather than slicing it out first
+        curindex = self._index
+        if curindex + fixed.size > len(self):
+            raise InternalDriverError(
+                f"cannot go beyond {len(self)} count={fixed.size} index={curindex} sbytes={self!r}"
+            )
+        self._index += fixed.size
+        return fixed.unpack_from(self, curindex)
+
+    def skip(self, count: int) -> None:
+        # move past data that was read in place, without slicing out a copy
+        if self._index + count > len(self):
+            raise InternalDriverError(
+                f"cannot go beyond {len(self)} count={count} index={self._index} sbytes={self!r}"
+            )
+        self._index += count
+
+    @property
+    def position(self) -> int:
+        return self._index
+
     def at_end(self) -> bool:
         return self._index == len(self)
 
@@ -76,15 +76,15 @@ class Dispatcher:
     ) -> Tuple[int, int, int, int, int, bytes]:
         assert self._reader is not None
         head = await self._reader.readexactly(9)
-        logger.debug(f"length of header={len(head)} at_eof={self._reader.at_eof()}")
+        logger.debug("length of header=%s at_eof=%s", len(head), self._reader.at_eof())
         version, flags, stream_id, opcode, length = decoder(head)
         body = await self._reader.readexactly(length)
-        logger.debug(f" got response head={head!r} body={body!r}")
+        logger.debug(" got response head=%r body=%r", head, body)
         if flags & Flags.COMPRESSION:
-            logger.debug(f"body={body!r}")
+            logger.debug("body=%r", body)
             assert self.decompress is not None
             body = self.decompress(body)
-            logger.debug(f"body={body!r}")
+            logger.debug("body=%r", body)
         return version, flags, stream_id, opcode, length, body
 
     async def end_all(
@@ -3,14 +3,20 @@ import decimal
 import ipaddress
 import uuid
 from collections.abc import Collection
-from struct import pack, unpack
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from functools import lru_cache
+from struct import Struct, error as StructError
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from .codecs import (
+    _INT,
+    _INT_INT,
+    _PACK_INT,
+    _PACK_LEN_INT,
+    _USHORT,
     NETWORK_ORDER,
     STypes,
-    decode_byte,
-    decode_consistency,
+    _encode_memoryview_value,
+    consistency_from_code,
     decode_inet,
     decode_int,
     decode_int_bytes_must,
@@ -27,7 +33,6 @@ from .codecs import (
     encode_strings_list,
     encode_value,
     encode_varint,
-    get_struct,
 )
 from .constants import (
     COMPRESS_MINIMUM,
@@ -45,7 +50,7 @@ from .constants import (
     TopologyStatus,
     WriteType,
 )
-from .core import SBytes, pretty_type
+from .core import SBytes, pretty_type, value_map
 from .exceptions import (
     BadInputException,
     InternalDriverError,
@@ -66,6 +71,65 @@ from .utils import get_logger
 
 logger = get_logger(__name__)
 
+_PACK_HEADER = Struct(
+    f"{NETWORK_ORDER}{STypes.BYTE.value}{STypes.BYTE.value}{STypes.SHORT.value}{STypes.BYTE.value}{STypes.INT.value}"
+).pack
+_PACK_CONS_FLAGS = Struct(
+    f"{NETWORK_ORDER}{STypes.USHORT.value}{STypes.BYTE.value}"
+).pack
+# length prefixed fixed width values
+_PACK_LEN_UINT = Struct(f"{NETWORK_ORDER}{STypes.INT.value}{STypes.UINT.value}").pack
+_PACK_LEN_I8 = Struct(f"{NETWORK_ORDER}{STypes.INT.value}{STypes.BYTE.value}").pack
+_PACK_LEN_S8 = Struct(f"{NETWORK_ORDER}{STypes.INT.value}{STypes.SBYTE.value}").pack
+_PACK_LEN_I16 = Struct(f"{NETWORK_ORDER}{STypes.INT.value}{STypes.SHORT.value}").pack
+_PACK_LEN_I64 = Struct(f"{NETWORK_ORDER}{STypes.INT.value}{STypes.LONG.value}").pack
+_PACK_LEN_DOUBLE = Struct(
+    f"{NETWORK_ORDER}{STypes.INT.value}{STypes.DOUBLE.value}"
+).pack
+_PACK_LEN_FLOAT = Struct(f"{NETWORK_ORDER}{STypes.INT.value}{STypes.FLOAT.value}").pack
+_UNPACK_DOUBLE = Struct(f"{NETWORK_ORDER}{STypes.DOUBLE.value}").unpack
+_UNPACK_FLOAT = Struct(f"{NETWORK_ORDER}{STypes.FLOAT.value}").unpack
+_UNPACK_INT_FROM = _INT.unpack_from
+# fixed width leading fields of the ERROR and ROWS bodies, read in one go
+_CL_INTS_FORMAT = (
+    f"{NETWORK_ORDER}{STypes.USHORT.value}{STypes.INT.value}{STypes.INT.value}"
+)
+_CL_INTS = Struct(_CL_INTS_FORMAT)
+_CL_INTS_BYTE = Struct(f"{_CL_INTS_FORMAT}{STypes.BYTE.value}")
+_CL_INTS_INT = Struct(f"{_CL_INTS_FORMAT}{STypes.INT.value}")
+_CL_INTS_INT_BYTE = Struct(f"{_CL_INTS_FORMAT}{STypes.INT.value}{STypes.BYTE.value}")
+_UUID_LENGTH = _PACK_INT(16)
+# BOOLEAN bound values only ever encode to one of these
+_BOOLEAN_TRUE = _PACK_LEN_I8(1, 1)
+_BOOLEAN_FALSE = _PACK_LEN_I8(1, 0)
+
+_ERROR_CODES = value_map(ErrorCode)
+_WRITE_TYPES = value_map(WriteType)
+_EVENTS = value_map(Events)
+_EVENT_NAMES = frozenset(_EVENTS)
+_SCHEMA_CHANGE_TYPES = value_map(SchemaChangeType)
+_SCHEMA_CHANGE_TARGETS = value_map(SchemaChangeTarget)
+_TOPOLOGY_STATUSES = value_map(TopologyStatus)
+_NODE_STATUSES = value_map(NodeStatus)
+
+# flag bits as plain ints, reading a member off an Enum class goes through the
+# metaclass and int ops on the member dispatch through the subclass
+_VALUES = int(QueryFlags.VALUES)
+_SKIP_METADATA = int(QueryFlags.SKIP_METADATA)
+_PAGE_SIZE = int(QueryFlags.PAGE_SIZE)
+_WITH_PAGING_STATE = int(QueryFlags.WITH_PAGING_STATE)
+_WITH_NAMES_FOR_VALUES = int(QueryFlags.WITH_NAMES_FOR_VALUES)
+_GLOBAL_TABLES_SPEC = int(ResultFlags.GLOBAL_TABLES_SPEC)
+_HAS_MORE_PAGES = int(ResultFlags.HAS_MORE_PAGES)
+_NO_METADATA = int(ResultFlags.NO_METADATA)
+
+# DATE is an unsigned day count with the unix epoch at 2**31
+_DATE_EPOCH = datetime.date(1970, 1, 1)
+_DATE_OFFSET = 1 << 31
+# TIMESTAMP is milliseconds since the unix epoch, naive datetimes are taken as UTC
+_TIMESTAMP_EPOCH = datetime.datetime(1970, 1, 1)
+_TIMESTAMP_EPOCH_UTC = _TIMESTAMP_EPOCH.replace(tzinfo=datetime.timezone.utc)
+
 
 class BaseMessage:
     pass
@@ -88,20 +152,19 @@ class RequestMessage(BaseMessage):
             self.flags |= Flags.COMPRESSION
             logger.debug("compressing the request")
             body = self.compress(body)
-        header: bytes = self.encode_header(len(body))
+        # a single concatenation is cheaper than packing into a preallocated
+        # bytearray, as that needs another copy to hand back immutable bytes
+        header: bytes = _PACK_HEADER(
+            self.version, self.flags, self.stream_id, self.opcode, len(body)
+        )
         logger.debug(
-            f"encoded request opcode={self.opcode} header={header!r} body={body!r}"
+            "encoded request opcode=%s header=%r body=%r", self.opcode, header, body
         )
         return header + body
 
     def encode_body(self) -> bytes:
         return b""
 
-    def encode_header(self, body_length: int) -> bytes:
-        return get_struct(
-            f"{NETWORK_ORDER}{STypes.BYTE}{STypes.BYTE}{STypes.SHORT}{STypes.BYTE}{STypes.INT}"
-        ).pack(self.version, self.flags, self.stream_id, self.opcode, body_length)
-
 
 class ResponseMessage(BaseMessage):
     opcode: int = -1
@@ -119,7 +182,7 @@ class ResponseMessage(BaseMessage):
         stream_id: int,
         body: "SBytes",
     ) -> "ResponseMessage":
-        logger.debug(f"creating msg class={cls} with body={body!r}")
+        logger.debug("creating msg class=%s with body=%r", cls, body)
         msg = cls.build(version, flags, stream_id, body)
         if not body.at_end():
             raise InternalDriverError(
@@ -145,7 +208,7 @@ class ReadyMessage(ResponseMessage):
     def build(
         version: int, flags: int, stream_id: int, body: "SBytes"
     ) -> "ReadyMessage":
-        logger.debug(f"ReadyResponse body={body!r}")
+        logger.debug("ReadyResponse body=%r", body)
         return ReadyMessage(version, flags, stream_id)
 
 
@@ -161,10 +224,110 @@ class SupportedMessage(ResponseMessage):
         version: int, flags: int, stream_id: int, body: "SBytes"
     ) -> "SupportedMessage":
         options = decode_string_multimap(body)
-        logger.debug(f"SupportedResponse options={options} body={body!r}")
+        logger.debug("SupportedResponse options=%s body=%r", options, body)
         return SupportedMessage(options, version, flags, stream_id)
 
 
+# error details, the values are read from body in the order they are listed
+
+
+def _decode_write_type(body: "SBytes") -> "WriteType":
+    string = decode_string(body)
+    write_type = _WRITE_TYPES.get(string)
+    if write_type is None:
+        raise InternalDriverError(f"unknown write_type={string}")
+    return write_type
+
+
+def _decode_unavailable_details(body: "SBytes") -> dict:
+    # <cl><required><alive>
+    cl, required, alive = body.unpack(_CL_INTS)
+    return {
+        "consistency_level": consistency_from_code(cl),
+        "required": required,
+        "alive": alive,
+    }
+
+
+def _decode_write_timeout_details(body: "SBytes") -> dict:
+    # <cl><received><blockfor><writeType>
+    cl, received, block_for = body.unpack(_CL_INTS)
+    return {
+        "consistency_level": consistency_from_code(cl),
+        "received": received,
+        "block_for": block_for,
+        "write_type": _decode_write_type(body),
+    }
+
+
+def _decode_read_timeout_details(body: "SBytes") -> dict:
+    # <cl><received><blockfor><data_present>
+    cl, received, block_for, data_present = body.unpack(_CL_INTS_BYTE)
+    return {
+        "consistency_level": consistency_from_code(cl),
+        "received": received,
+        "block_for": block_for,
+        "data_present": data_present,
+    }
+
+
+def _decode_read_failure_details(body: "SBytes") -> dict:
+    # <cl><received><blockfor><numfailures><data_present>
+    fields = body.unpack(_CL_INTS_INT_BYTE)
+    cl, received, block_for, num_failures, data_present = fields
+    return {
+        "consistency_level": consistency_from_code(cl),
+        "received": received,
+        "block_for": block_for,
+        "num_failures": num_failures,
+        "data_present": data_present,
+    }
+
+
+def _decode_function_failure_details(body: "SBytes") -> dict:
+    return {
+        "keyspace": decode_string(body),
+        "function": decode_string(body),
+        "arg_types": decode_strings_list(body),
+    }
+
+
+def _decode_write_failure_details(body: "SBytes") -> dict:
+    # <cl><received><blockfor><numfailures><write_type>
+    cl, received, block_for, num_failures = body.unpack(_CL_INTS_INT)
+    return {
+        "consistency_level": consistency_from_code(cl),
+        "received": received,
+        "block_for": block_for,
+        "num_failures": num_failures,
+        "write_type": _decode_write_type(body),
+    }
+
+
+def _decode_already_exists_details(body: "SBytes") -> dict:
+    return {
+        "keyspace": decode_string(body),
+        "table": decode_string(body),
+    }
+
+
+def _decode_unprepared_details(body: "SBytes") -> dict:
+    return {"statement_id": decode_short_bytes(body)}
+
+
+# error codes without an entry have no details
+_ERROR_DETAIL_DECODERS: Dict[int, Callable[["SBytes"], dict]] = {
+    ErrorCode.UNAVAILABLE_EXCEPTION: _decode_unavailable_details,
+    ErrorCode.WRITE_TIMEOUT: _decode_write_timeout_details,
+    ErrorCode.READ_TIMEOUT: _decode_read_timeout_details,
+    ErrorCode.READ_FAILURE: _decode_read_failure_details,
+    ErrorCode.FUNCTION_FAILURE: _decode_function_failure_details,
+    ErrorCode.WRITE_FAILURE: _decode_write_failure_details,
+    ErrorCode.ALREADY_EXISTS: _decode_already_exists_details,
+    ErrorCode.UNPREPARED: _decode_unprepared_details,
+}
+
+
 class ErrorMessage(ResponseMessage):
     opcode = Opcode.ERROR
 
@@ -180,67 +343,39 @@ class ErrorMessage(ResponseMessage):
     def build(
         version: int, flags: int, stream_id: int, body: "SBytes"
     ) -> "ErrorMessage":
-        logger.debug(f"ErrorResponse body={body!r}")
+        logger.debug("ErrorResponse body=%r", body)
         details: dict = {}
         code = decode_int(body)
-        try:
-            error_code = ErrorCode(code)
-        except ValueError:
+        error_code = _ERROR_CODES.get(code)
+        if error_code is None:
             raise InternalDriverError(f"unknown error_code={code:x}")
         error_text = decode_string(body)
-        if error_code == ErrorCode.UNAVAILABLE_EXCEPTION:
-            #                 <cl><required><alive>
-            details["consistency_level"] = decode_consistency(body)
-            details["required"] = decode_int(body)
-            details["alive"] = decode_int(body)
-        elif error_code == ErrorCode.WRITE_TIMEOUT:
-            #                 <cl><received><blockfor><writeType>
-            details["consistency_level"] = decode_consistency(body)
-            details["received"] = decode_int(body)
-            details["block_for"] = decode_int(body)
-            string = decode_string(body)
-            try:
-                details["write_type"] = WriteType(string)
-            except ValueError:
-                raise InternalDriverError("unknown write_type={string}")
-        elif error_code == ErrorCode.READ_TIMEOUT:
-            # <cl><received><blockfor><data_present>
-            details["consistency_level"] = decode_consistency(body)
-            details["received"] = decode_int(body)
-            details["block_for"] = decode_int(body)
-            details["data_present"] = decode_byte(body)
-        elif error_code == ErrorCode.READ_FAILURE:
-            # <cl><received><blockfor><numfailures><data_present>
-            details["consistency_level"] = decode_consistency(body)
-            details["received"] = decode_int(body)
-            details["block_for"] = decode_int(body)
-            details["num_failures"] = decode_int(body)
-            details["data_present"] = decode_byte(body)
-        elif error_code == ErrorCode.FUNCTION_FAILURE:
-            details["keyspace"] = decode_string(body)
-            details["function"] = decode_string(body)
-            details["arg_types"] = decode_strings_list(body)
-        elif error_code == ErrorCode.WRITE_FAILURE:
-            # <cl><received><blockfor><numfailures><write_type>
-            details["consistency_level"] = decode_consistency(body)
-            details["received"] = decode_int(body)
-            details["block_for"] = decode_int(body)
-            details["num_failures"] = decode_int(body)
-            details["data_present"] = decode_byte(body)
-            string = decode_string(body)
-            try:
-                details["write_type"] = WriteType(string)
-            except ValueError:
-                raise InternalDriverError("unknown write_type={string}")
-        elif error_code == ErrorCode.ALREADY_EXISTS:
-            details["keyspace"] = decode_string(body)
-            details["table"] = decode_string(body)
-        elif error_code == ErrorCode.UNPREPARED:
-            details["statement_id"] = decode_short_bytes(body)
-        logger.debug(f"ErrorMessage error_code={error_code:x}")
+        decode_details = _ERROR_DETAIL_DECODERS.get(error_code)
+        if decode_details is not None:
+            details = decode_details(body)
+        logger.debug("ErrorMessage error_code=%x", error_code)
         return ErrorMessage(error_code, error_text, details, version, flags, stream_id)
 
 
+# change events
+
+
+def _decode_topology_change(body: "SBytes") -> "TopologyChange":
+    status = decode_string(body)
+    topology_status = _TOPOLOGY_STATUSES.get(status)
+    if topology_status is None:
+        raise UnknownPayloadException(f"got unexpected status_change={status}")
+    return TopologyChange(topology_status, decode_inet(body))
+
+
+def _decode_status_change(body: "SBytes") -> "StatusChange":
+    status = decode_string(body)
+    node_status = _NODE_STATUSES.get(status)
+    if node_status is None:
+        raise UnknownPayloadException(f"got unexpected status_change={status}")
+    return StatusChange(node_status, decode_inet(body))
+
+
 class EventMessage(ResponseMessage):
     opcode = Opcode.RESULT
 
@@ -253,30 +388,35 @@ class EventMessage(ResponseMessage):
     def decode_schema_change(body: "SBytes") -> "SchemaChange":
         # <change_type>
         string = decode_string(body)
-        try:
-            change_type = SchemaChangeType(string)
-        except ValueError:
+        change_type = _SCHEMA_CHANGE_TYPES.get(string)
+        if change_type is None:
             raise UnknownPayloadException(f"got unexpected change_type={string}")
         # <target>
         string = decode_string(body)
-        try:
-            target = SchemaChangeTarget(string)
-        except ValueError:
+        target = _SCHEMA_CHANGE_TARGETS.get(string)
+        if target is None:
             raise UnknownPayloadException(f"got unexpected target={string}")
         # <options>
         options: Dict[str, Union[str, List[str]]] = {}
         if target == SchemaChangeTarget.KEYSPACE:
-            options["target_name"] = decode_string(body)
+            options = {"target_name": decode_string(body)}
         elif target in (SchemaChangeTarget.TABLE, SchemaChangeTarget.TYPE):
-            options["keyspace_name"] = decode_string(body)
-            options["target_name"] = decode_string(body)
+            options = {
+                "keyspace_name": decode_string(body),
+                "target_name": decode_string(body),
+            }
         elif target in (SchemaChangeTarget.FUNCTION, SchemaChangeTarget.AGGREGATE):
-            options["keyspace_name"] = decode_string(body)
-            options["target_name"] = decode_string(body)
-            options["argument_types"] = decode_strings_list(body)
+            options = {
+                "keyspace_name": decode_string(body),
+                "target_name": decode_string(body),
+                "argument_types": decode_strings_list(body),
+            }
 
         logger.debug(
-            f"SCHEMA_CHANGE change_type={change_type} target={target} options={options}"
+            "SCHEMA_CHANGE change_type=%s target=%s options=%s",
+            change_type,
+            target,
+            options,
         )
         return SchemaChange(change_type, target, options)
 
@@ -285,34 +425,178 @@ class EventMessage(ResponseMessage):
         version: int, flags: int, stream_id: int, body: "SBytes",
     ) -> "EventMessage":
         event = decode_string(body)
-        try:
-            event_type = Events(event)
-        except ValueError:
+        event_type = _EVENTS.get(event)
+        if event_type is None:
             raise UnknownPayloadException(f"got unexpected event={event}")
-        event_obj: Optional["ChangeEvent"] = None
-        if event_type == Events.TOPOLOGY_CHANGE:
-            status = decode_string(body)
-            try:
-                topology_status = TopologyStatus(status)
-            except ValueError:
-                raise UnknownPayloadException(f"got unexpected status_change={status}")
-            node = decode_inet(body)
-            event_obj = TopologyChange(topology_status, node)
-        elif event_type == Events.STATUS_CHANGE:
-            status = decode_string(body)
-            try:
-                node_status = NodeStatus(status)
-            except ValueError:
-                raise UnknownPayloadException(f"got unexpected status_change={status}")
-            node = decode_inet(body)
-            event_obj = StatusChange(node_status, node)
-        elif event_type == Events.SCHEMA_CHANGE:
-            event_obj = EventMessage.decode_schema_change(body)
-        assert event_obj is not None
-
+        event_obj = _EVENT_DECODERS[event_type](body)
         return EventMessage(event_type, event_obj, version, flags, stream_id)
 
 
+_EVENT_DECODERS: Dict[str, Callable[["SBytes"], "ChangeEvent"]] = {
+    Events.TOPOLOGY_CHANGE: _decode_topology_change,
+    Events.STATUS_CHANGE: _decode_status_change,
+    Events.SCHEMA_CHANGE: EventMessage.decode_schema_change,
+}
+
+
+# the column types that have no <value> after their option_id, ASCII to TINYINT,
+# a set membership test is cheaper than the chained range comparison
+_SIMPLE_OPTION_IDS = frozenset(range(OptionID.ASCII, OptionID.TINYINT + 1))
+
+# option_id -> (struct format, length) of cells that always have the same width
+_FIXED_WIDTH_CELLS: Dict[int, Tuple[str, int]] = {
+    OptionID.INT: (STypes.INT.value, 4),
+    OptionID.BIGINT: (STypes.LONG.value, 8),
+    OptionID.SMALLINT: (STypes.SHORT.value, 2),
+    OptionID.TINYINT: (STypes.SBYTE.value, 1),
+    OptionID.TIME: (STypes.LONG.value, 8),
+    OptionID.DOUBLE: (STypes.DOUBLE.value, 8),
+    OptionID.FLOAT: (STypes.FLOAT.value, 4),
+}
+
+
+# cell decoders for ROWS results, chosen once per column
+
+
+def _decode_varint_cell(value: bytes) -> int:
+    return int.from_bytes(value, byteorder="big", signed=True)
+
+
+def _fixed_int_cell_decoder(option_id: int) -> Callable[[bytes], int]:
+    stype, length = _FIXED_WIDTH_CELLS[option_id]
+    unpack_int = Struct(f"{NETWORK_ORDER}{stype}").unpack
+
+    def decode(value: bytes) -> int:
+        if len(value) != length:
+            return _decode_varint_cell(value)
+        return unpack_int(value)[0]
+
+    return decode
+
+
+def _decode_blob_cell(value: bytes) -> bytes:
+    return value
+
+
+def _decode_string_cell(value: bytes) -> str:
+    return value.decode("utf-8")
+
+
+def _decode_decimal_cell(value: bytes) -> "decimal.Decimal":
+    if len(value) < 4:
+        raise InternalDriverError(f"decimal cell too short, length={len(value)}")
+    scale = int.from_bytes(value[:4], byteorder="big", signed=True)
+    unscaled = int.from_bytes(value[4:], byteorder="big", signed=True)
+    return decimal.Decimal(unscaled) * 10 ** (-1 * decimal.Decimal(scale))
+
+
+def _decode_double_cell(value: bytes) -> float:
+    return _UNPACK_DOUBLE(value)[0]
+
+
+def _decode_float_cell(value: bytes) -> float:
+    return _UNPACK_FLOAT(value)[0]
+
+
+def _decode_inet_cell(
+    value: bytes,
+) -> Union["ipaddress.IPv4Address", "ipaddress.IPv6Address"]:
+    if len(value) not in (4, 16,):
+        raise InternalDriverError(
+            f"option={OptionID.INET:x} not exepected length 4 or 16, length={len(value)}"
+        )
+    return (
+        ipaddress.IPv4Address(value)
+        if len(value) == 4
+        else ipaddress.IPv6Address(value)
+    )
+
+
+def _decode_uuid_cell(value: bytes) -> "uuid.UUID":
+    uuidint = int.from_bytes(value, byteorder="big", signed=False)
+    return uuid.UUID(int=uuidint)
+
+
+def _decode_boolean_cell(value: bytes) -> bool:
+    return False if value == b"\x00" else True
+
+
+def _decode_timestamp_cell(value: bytes) -> "datetime.datetime":
+    timestamp = int.from_bytes(value, byteorder="big", signed=False)
+    return datetime.datetime.utcfromtimestamp(timestamp / 10 ** 3)
+
+
+def _decode_date_cell(value: bytes) -> "datetime.date":
+    date = int.from_bytes(value, byteorder="big", signed=False)
+    return _DATE_EPOCH + datetime.timedelta(days=date - _DATE_OFFSET)
+
+
+_CELL_DECODERS: Dict[int, Callable[[bytes], "ExpectedType"]] = {
+    OptionID.INT: _fixed_int_cell_decoder(OptionID.INT),
+    OptionID.BIGINT: _fixed_int_cell_decoder(OptionID.BIGINT),
+    OptionID.SMALLINT: _fixed_int_cell_decoder(OptionID.SMALLINT),
+    OptionID.TIME: _fixed_int_cell_decoder(OptionID.TIME),
+    OptionID.TINYINT: _fixed_int_cell_decoder(OptionID.TINYINT),
+    OptionID.VARINT: _decode_varint_cell,
+    OptionID.BLOB: _decode_blob_cell,
+    OptionID.ASCII: _decode_string_cell,
+    OptionID.VARCHAR: _decode_string_cell,
+    OptionID.DECIMAL: _decode_decimal_cell,
+    OptionID.DOUBLE: _decode_double_cell,
+    OptionID.FLOAT: _decode_float_cell,
+    OptionID.INET: _decode_inet_cell,
+    OptionID.TIMEUUID: _decode_uuid_cell,
+    OptionID.UUID: _decode_uuid_cell,
+    OptionID.BOOLEAN: _decode_boolean_cell,
+    OptionID.TIMESTAMP: _decode_timestamp_cell,
+    OptionID.DATE: _decode_date_cell,
+}
+
+
+def _cell_decoder(option_id: int) -> Callable[[bytes], "ExpectedType"]:
+    try:
+        return _CELL_DECODERS[option_id]
+    except KeyError:
+        pass
+
+    # only fail if there is a cell to decode
+    def unknown(value: bytes) -> "ExpectedType":
+        raise InternalDriverError(
+            f"unknown option_id={option_id:x} with value={value!r}"
+        )
+
+    return unknown
+
+
+# result layouts repeat for the same statements, but ad-hoc queries can
+# produce any number of them, so only keep the recent ones
+_ROW_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_ROW_CACHE_SIZE)
+def _fixed_width_row(
+    option_ids: Tuple[int, ...]
+) -> Optional[Tuple[Struct, Tuple[int, ...]]]:
+    # the row Struct and cell lengths, or None if a column is variable width
+    if not all(option_id in _FIXED_WIDTH_CELLS for option_id in option_ids):
+        return None
+    fmt = NETWORK_ORDER
+    lengths = []
+    for option_id in option_ids:
+        stype, length = _FIXED_WIDTH_CELLS[option_id]
+        fmt += f"{STypes.INT.value}{stype}"
+        lengths.append(length)
+    return (Struct(fmt), tuple(lengths))
+
+
+@lru_cache(maxsize=_ROW_CACHE_SIZE)
+def _row_decoders(
+    option_ids: Tuple[int, ...]
+) -> Tuple[Tuple[int, Callable[[bytes], "ExpectedType"]], ...]:
+    # the (column index, cell decoder) pairs for rows of these column types
+    return tuple(enumerate(_cell_decoder(option_id) for option_id in option_ids))
+
+
 class ResultMessage(ResponseMessage):
     opcode = Opcode.RESULT
 
@@ -325,230 +609,260 @@ class ResultMessage(ResponseMessage):
         result_flags: int, columns_count: int, body: "SBytes"
     ) -> List[dict]:
         # <global_table_spec>
-        global_keyspace: Optional[str] = None
-        global_table: Optional[str] = None
-        if result_flags & ResultFlags.GLOBAL_TABLES_SPEC != 0:
+        # the flag is the same for every column, so it is only tested once
+        uses_global_spec = result_flags & _GLOBAL_TABLES_SPEC != 0
+        global_keyspace = global_table = ""
+        if uses_global_spec:
             # <keyspace>
             global_keyspace = decode_string(body)
             # <table>
             global_table = decode_string(body)
             logger.debug(
-                f"using global_table_spec keyspace={global_keyspace} table={global_table} result_flags={result_flags!r}"
+                "using global_table_spec keyspace=%s table=%s result_flags=%r",
+                global_keyspace,
+                global_table,
+                result_flags,
             )
+        else:
+            logger.debug("not using global_table_spec")
         # <col_spec_i>
-        col_specs = []
-        if columns_count > 0:
-            for _col in range(columns_count):
-                col_spec: Dict[str, Union[str, int]] = {}
-                if result_flags & ResultFlags.GLOBAL_TABLES_SPEC == 0:
-                    # <ksname><tablename>
-                    logger.debug(f"not using global_table_spec")
-
-                    col_spec["ksname"] = decode_string(body)
-                    col_spec["tablename"] = decode_string(body)
-                else:
-                    assert global_keyspace is not None
-                    assert global_table is not None
-                    col_spec["ksname"] = global_keyspace
-                    col_spec["tablename"] = global_table
-                # <name><type>
-                col_spec["name"] = decode_string(body)
-                # <type>
-                option_id = decode_short(body)
-                if option_id < 0x0001 or option_id > 0x0014:
-                    raise InternalDriverError(f"unhandled option_id={option_id}")
-                col_spec["option_id"] = option_id
-                col_specs.append(col_spec)
-        logger.debug(f"col_specs={col_specs}")
+        col_specs: List[dict] = []
+        # locals, as the loop runs once per column of every RESULT
+        read_string = decode_string
+        read_short = decode_short
+        simple_option_ids = _SIMPLE_OPTION_IDS
+        append = col_specs.append
+        for _col in range(columns_count):
+            if uses_global_spec:
+                ksname, tablename = global_keyspace, global_table
+            else:
+                # <ksname><tablename>
+                ksname = read_string(body)
+                tablename = read_string(body)
+            # <name>
+            name = read_string(body)
+            # <type>
+            option_id = read_short(body)
+            if option_id not in simple_option_ids:
+                raise InternalDriverError(f"unhandled option_id={option_id}")
+            append(
+                {
+                    "ksname": ksname,
+                    "tablename": tablename,
+                    "name": name,
+                    "option_id": option_id,
+                }
+            )
+        logger.debug("col_specs=%s", col_specs)
         return col_specs
 
     @staticmethod
-    def build(
-        version: int, flags: int, stream_id: int, body: "SBytes",
-    ) -> "ResultMessage":
-        msg: Optional["ResultMessage"] = None
-        kind = decode_int(body)
-        logger.debug(f"ResultResponse kind={kind} body={body!r}")
-        if kind == Kind.VOID:
-            msg = VoidResultMessage(kind, version, flags, stream_id)
-        elif kind == Kind.ROWS:
-            result_flags = decode_int(body)
-            columns_count = decode_int(body)
-            logger.debug(
-                f"ResultResponse result_flags={result_flags} columns_count={columns_count}"
-            )
-            paging_state = None
-            if result_flags & ResultFlags.HAS_MORE_PAGES:
-                # parse paging state
-                paging_state = decode_int_bytes_must(body)
-            col_specs = None
-            if (result_flags & ResultFlags.NO_METADATA) == 0x00 and columns_count > 0:
-                col_specs = ResultMessage.decode_col_specs(
-                    result_flags, columns_count, body
-                )
-            # parse rows
-            if paging_state is not None:
-                rows: "Rows" = PagingRows(
-                    col_specs=col_specs, paging_state=paging_state
-                )
-            else:
-                rows = Rows(col_specs=col_specs)
-            rows_count = decode_int(body)
-            if result_flags & ResultFlags.HAS_MORE_PAGES and rows_count == 0:
-                raise InternalDriverError(
-                    f"unsupported has more pages and zero row result"
-                )
-            for _rowcnt in range(rows_count):
-                row: List[Optional["ExpectedType"]] = []
-                for colcnt in range(columns_count):
-                    cell: Optional["ExpectedType"] = None
-                    value = SBytes(decode_int_bytes_must(body))
-                    if col_specs is None:
-                        row.append(bytes(value))
-                    else:
-                        spec = col_specs[colcnt]
-                        if spec["option_id"] in (
-                            OptionID.INT,
-                            OptionID.BIGINT,
-                            OptionID.SMALLINT,
-                            OptionID.TIME,
-                            OptionID.TINYINT,
-                            OptionID.VARINT,
-                        ):
-                            cell = int.from_bytes(value, byteorder="big", signed=True)
-                        elif spec["option_id"] in (OptionID.BLOB,):
-                            cell = value
-                        elif spec["option_id"] in (OptionID.ASCII, OptionID.VARCHAR):
-                            cell = value.decode("utf-8")
-                        elif spec["option_id"] in (OptionID.DECIMAL,):
-                            scale = decode_int(value)
-                            unscaled = int.from_bytes(
-                                value.remaining, byteorder="big", signed=True
-                            )
-                            cell = decimal.Decimal(unscaled) * 10 ** (
-                                -1 * decimal.Decimal(scale)
-                            )
-                        elif spec["option_id"] in (OptionID.DOUBLE,):
-                            cell = unpack(f"{NETWORK_ORDER}{STypes.DOUBLE}", value)[0]
-                        elif spec["option_id"] in (OptionID.FLOAT,):
-                            cell = unpack(f"{NETWORK_ORDER}{STypes.FLOAT}", value)[0]
-                        elif spec["option_id"] in (OptionID.INET,):
-                            ipaddr = int.from_bytes(
-                                value.remaining, byteorder="big", signed=False
-                            )
-                            if len(value) not in (4, 16,):
-                                raise InternalDriverError(
-                                    f"option={spec['option_id']:x} not exepected length 4 or 16, length={len(value)}"
-                                )
-                            cell = (
-                                ipaddress.IPv4Address(ipaddr)
-                                if len(value) == 4
-                                else ipaddress.IPv6Address(ipaddr)
-                            )
-                        elif spec["option_id"] in (OptionID.TIMEUUID, OptionID.UUID):
-                            uuidint = int.from_bytes(
-                                value.remaining, byteorder="big", signed=False
-                            )
-                            cell = uuid.UUID(int=uuidint)
-                        elif spec["option_id"] in (OptionID.BOOLEAN,):
-                            cell = False if value == b"\x00" else True
-                        elif spec["option_id"] in (OptionID.TIMESTAMP,):
-                            timestamp = int.from_bytes(
-                                value, byteorder="big", signed=False
-                            )
-                            # logger.debug(f"date={date} pathma={date-2**31} value={value!r}")
-                            cell = datetime.datetime.utcfromtimestamp(
-                                timestamp / 10 ** 3
-                            )
-                        elif spec["option_id"] in (OptionID.DATE,):
-                            date = int.from_bytes(value, byteorder="big", signed=False)
-                            # logger.debug(f"date={date} pathma={date-2**31} value={value!r}")
-                            cell = datetime.datetime.fromtimestamp(
-                                0, datetime.timezone.utc
-                            ).date() + datetime.timedelta(days=date - 2 ** 31)
-                        else:
-                            raise InternalDriverError(
-                                f"unknown option_id={spec['option_id']:x} with value={value!r}"
-                            )
-                        # logger.debug(f"got cell={cell} with option_id={spec['option_id']:x} for value={value} with type={type(cell)}")
-                        row.append(cell)
-
-                rows.add_row(tuple(row))
-            logger.debug(f"got col_specs={col_specs}")
-            msg = RowsResultMessage(rows, kind, version, flags, stream_id)
-
-        elif kind == Kind.SET_KEYSPACE:
-            keyspace = decode_string(body)
-            msg = SetKeyspaceResultMessage(keyspace, kind, version, flags, stream_id)
-        elif kind == Kind.PREPARED:
-            # <id>
-            statement_id = decode_short_bytes(body)
-            if statement_id == b"":
-                raise InternalDriverError("cannot use empty prepared statement_id")
-            # <metadata>
-            # <flags>
-            result_flags = decode_int(body)
-            # <columns_count>
-            columns_count = decode_int(body)
-            # <pk_count>
-            pk_count = decode_int(body)
-            pk_index: List[int] = []
-            if pk_count > 0:
-                pk_index = list(
-                    unpack(
-                        f"{NETWORK_ORDER}{STypes.USHORT * pk_count}",
-                        body.grab(2 * pk_count),
+    def decode_fixed_width_rows(
+        option_ids: Optional[Tuple[int, ...]], rows_count: int, body: "SBytes"
+    ) -> Optional[List[Tuple["ExpectedType", ...]]]:
+        # when every column has a fixed width, a row is a fixed layout of
+        # <length><value> pairs, so all rows can be unpacked by one Struct
+        if not option_ids or rows_count == 0:
+            return None
+        row_layout = _fixed_width_row(option_ids)
+        if row_layout is None:
+            return None
+        row_struct, expected = row_layout
+        rows_size = rows_count * row_struct.size
+        if len(body) - body.position != rows_size:
+            return None
+        fixed_rows = []
+        # a view of the rows, so the body is not copied just to be unpacked
+        for values in row_struct.iter_unpack(memoryview(body)[body.position :]):
+            if values[0::2] != expected:
+                # empty values and the like use the cell decoders
+                return None
+            fixed_rows.append(values[1::2])
+        body.skip(rows_size)
+        return fixed_rows
+
+    @staticmethod
+    def decode_rows(
+        col_specs: Optional[List[dict]],
+        columns_count: int,
+        rows_count: int,
+        body: "SBytes",
+    ) -> List[Tuple["ExpectedType", ...]]:
+        # all of the per cell work of a ROWS result happens here, the column
+        # types are pulled out of col_specs once and the rest is keyed on them
+        option_ids = None
+        if col_specs is not None:
+            option_ids = tuple(spec["option_id"] for spec in col_specs)
+        fixed_rows = ResultMessage.decode_fixed_width_rows(option_ids, rows_count, body)
+        if fixed_rows is not None:
+            return fixed_rows
+        columns: Tuple[Tuple[int, Callable[[bytes], "ExpectedType"]], ...]
+        if option_ids is None:
+            columns = tuple(enumerate((bytes,) * columns_count))
+        else:
+            columns = _row_decoders(option_ids)
+        # walk the cells with an offset into body itself rather than grabbing
+        # each <length><value> off it, and only move body along at the end
+        cells = body
+        size = len(cells)
+        unpack_length = _UNPACK_INT_FROM
+        empty_row: List["ExpectedType"] = [None] * len(columns)
+        start = offset = body.position
+        rows = []
+        for _rowcnt in range(rows_count):
+            # null cells are left as the None they start out as
+            row = empty_row[:]
+            for index, decoder in columns:
+                if offset + 4 > size:
+                    raise InternalDriverError(
+                        f"cannot go beyond {size} count=4 index={offset}"
                     )
-                )
-            logger.debug(
-                f"build statement_id={statement_id!r} result_flags={result_flags} "
-                + f"columns_count={columns_count} pk_count={pk_count} pk_index={pk_index}"
-            )
+                (length,) = unpack_length(cells, offset)
+                offset += 4
+                if length < 0:
+                    continue
+                end = offset + length
+                if end > size:
+                    raise InternalDriverError(
+                        f"cannot go beyond {size} count={length} index={offset}"
+                    )
+                row[index] = decoder(cells[offset:end])
+                offset = end
+            rows.append(tuple(row))
+        body.skip(offset - start)
+        return rows
+
+    @staticmethod
+    def build_void(
+        kind: int, version: int, flags: int, stream_id: int, body: "SBytes"
+    ) -> "ResultMessage":
+        return VoidResultMessage(kind, version, flags, stream_id)
+
+    @staticmethod
+    def build_rows(
+        kind: int, version: int, flags: int, stream_id: int, body: "SBytes"
+    ) -> "ResultMessage":
+        result_flags, columns_count = body.unpack(_INT_INT)
+        logger.debug(
+            "ResultResponse result_flags=%s columns_count=%s",
+            result_flags,
+            columns_count,
+        )
+        paging_state = None
+        if result_flags & _HAS_MORE_PAGES:
+            # parse paging state
+            paging_state = decode_int_bytes_must(body)
+        col_specs = None
+        if (result_flags & _NO_METADATA) == 0x00 and columns_count > 0:
             col_specs = ResultMessage.decode_col_specs(
                 result_flags, columns_count, body
             )
-            # <result_metadata>
-            # <flags>
-            results_result_flags = decode_int(body)
-            # <columns_count>
-            results_columns_count = decode_int(body)
-            if result_flags & ResultFlags.HAS_MORE_PAGES != 0x00:
-                raise InternalDriverError(f"need to parse paging state")
-
-            if bool(results_result_flags & ResultFlags.NO_METADATA) != bool(
-                results_columns_count == 0
-            ):
-                raise InternalDriverError(
-                    f" unexpected results_result_flags={results_result_flags} results_columns_count={results_columns_count}"
-                )
-            results_col_specs = None
-            if (
-                results_result_flags & ResultFlags.NO_METADATA == 0x00
-                and results_columns_count > 0
-            ):
-                results_col_specs = ResultMessage.decode_col_specs(
-                    results_result_flags, results_columns_count, body
-                )
-            msg = PreparedResultMessage(
-                statement_id,
-                col_specs,
-                pk_index,
-                kind,
-                version,
-                flags,
-                stream_id,
-                results_col_specs=results_col_specs,
-            )
-        elif kind == Kind.SCHEMA_CHANGE:
-            schema_change = EventMessage.decode_schema_change(body)
-            msg = SchemaResultMessage(schema_change, kind, version, flags, stream_id)
+        # parse rows
+        if paging_state is not None:
+            rows: "Rows" = PagingRows(col_specs=col_specs, paging_state=paging_state)
         else:
-            raise UnknownPayloadException(f"RESULT message has unknown kind={kind}")
-        if msg is None:
+            rows = Rows(col_specs=col_specs)
+        rows_count = decode_int(body)
+        if result_flags & _HAS_MORE_PAGES and rows_count == 0:
+            raise InternalDriverError(f"unsupported has more pages and zero row result")
+        rows.add_rows(
+            ResultMessage.decode_rows(col_specs, columns_count, rows_count, body)
+        )
+        logger.debug("got col_specs=%s", col_specs)
+        return RowsResultMessage(rows, kind, version, flags, stream_id)
+
+    @staticmethod
+    def build_set_keyspace(
+        kind: int, version: int, flags: int, stream_id: int, body: "SBytes"
+    ) -> "ResultMessage":
+        keyspace = decode_string(body)
+        return SetKeyspaceResultMessage(keyspace, kind, version, flags, stream_id)
+
+    @staticmethod
+    def build_prepared(
+        kind: int, version: int, flags: int, stream_id: int, body: "SBytes"
+    ) -> "ResultMessage":
+        # <id>
+        statement_id = decode_short_bytes(body)
+        if statement_id == b"":
+            raise InternalDriverError("cannot use empty prepared statement_id")
+        # <metadata>
+        # <flags>
+        result_flags = decode_int(body)
+        # <columns_count>
+        columns_count = decode_int(body)
+        # <pk_count>
+        pk_count = decode_int(body)
+        pk_index: List[int] = []
+        if pk_count > 0:
+            pk_index = [
+                index for (index,) in _USHORT.iter_unpack(body.grab(2 * pk_count))
+            ]
+        logger.debug(
+            "build statement_id=%r result_flags=%s columns_count=%s pk_count=%s pk_index=%s",
+            statement_id,
+            result_flags,
+            columns_count,
+            pk_count,
+            pk_index,
+        )
+        col_specs = ResultMessage.decode_col_specs(result_flags, columns_count, body)
+        # <result_metadata>
+        # <flags>
+        results_result_flags = decode_int(body)
+        # <columns_count>
+        results_columns_count = decode_int(body)
+        if result_flags & _HAS_MORE_PAGES != 0x00:
+            raise InternalDriverError(f"need to parse paging state")
+
+        if bool(results_result_flags & _NO_METADATA) != bool(
+            results_columns_count == 0
+        ):
             raise InternalDriverError(
-                f"ResultResponse no msg generated for body={body!r}"
+                f" unexpected results_result_flags={results_result_flags} results_columns_count={results_columns_count}"
             )
-        return msg
+        results_col_specs = None
+        if results_result_flags & _NO_METADATA == 0x00 and results_columns_count > 0:
+            results_col_specs = ResultMessage.decode_col_specs(
+                results_result_flags, results_columns_count, body
+            )
+        return PreparedResultMessage(
+            statement_id,
+            col_specs,
+            pk_index,
+            kind,
+            version,
+            flags,
+            stream_id,
+            results_col_specs=results_col_specs,
+        )
+
+    @staticmethod
+    def build_schema_change(
+        kind: int, version: int, flags: int, stream_id: int, body: "SBytes"
+    ) -> "ResultMessage":
+        schema_change = EventMessage.decode_schema_change(body)
+        return SchemaResultMessage(schema_change, kind, version, flags, stream_id)
+
+    @staticmethod
+    def build(
+        version: int, flags: int, stream_id: int, body: "SBytes",
+    ) -> "ResultMessage":
+        kind = decode_int(body)
+        logger.debug("ResultResponse kind=%s body=%r", kind, body)
+        build_kind = _RESULT_BUILDERS.get(kind)
+        if build_kind is None:
+            raise UnknownPayloadException(f"RESULT message has unknown kind={kind}")
+        return build_kind(kind, version, flags, stream_id, body)
+
+
+_RESULT_BUILDERS: Dict[int, Callable[..., "ResultMessage"]] = {
+    Kind.VOID: ResultMessage.build_void,
+    Kind.ROWS: ResultMessage.build_rows,
+    Kind.SET_KEYSPACE: ResultMessage.build_set_keyspace,
+    Kind.PREPARED: ResultMessage.build_prepared,
+    Kind.SCHEMA_CHANGE: ResultMessage.build_schema_change,
+}
 
 
 class SetKeyspaceResultMessage(ResultMessage):
@@ -591,6 +905,185 @@ class PreparedResultMessage(ResultMessage):
         self.statement_id = statement_id
 
 
+# bound value encoders for prepared statements, chosen by the column option_id
+
+
+def _int_param_encoder(
+    option_id: int, pack: Callable[[int, int], bytes], length: int
+) -> Callable[[Any], bytes]:
+    # struct already rejects anything that is not an int, so only pay for
+    # working out why when the pack fails
+    def encode(value: Any) -> bytes:
+        try:
+            return pack(length, value)
+        except StructError:
+            if isinstance(value, int):
+                raise BadInputException(
+                    f"value for type={option_id} is out of range for value={value!r}"
+                )
+            raise BadInputException(
+                f"expected type=int but got type={pretty_type(value)} for value={value!r}"
+            )
+
+    return encode
+
+
+def _encode_varint_param(value: Any) -> bytes:
+    if not isinstance(value, int):
+        raise BadInputException(
+            f"expected type=int but got type={pretty_type(value)} for value={value!r}"
+        )
+    res = encode_varint(value)
+    return _PACK_INT(len(res)) + res
+
+
+def _encode_blob_param(value: Any) -> bytes:
+    if isinstance(value, memoryview):
+        return _encode_memoryview_value(value)
+    if not isinstance(value, (bytes, bytearray)):
+        raise BadInputException(
+            f"expected type=bytes/bytearray/memoryview but got type={pretty_type(value)} for value={value!r}"
+        )
+    return _PACK_INT(len(value)) + value
+
+
+def _encode_time_param(value: Any) -> bytes:
+    # what about buffer
+    if not isinstance(value, int):
+        raise BadInputException(
+            f"expected type=int but got type={pretty_type(value)} for value={value!r}"
+        )
+    maxvalue = 60 * 60 * 24 * 10 ** 9 - 1
+    if not 0 <= value < maxvalue:
+        raise BadInputException(
+            f"value for type={OptionID.TIME} is out of range 0 < X < {maxvalue} for value={value!r}"
+        )
+    return _PACK_LEN_I64(8, value)
+
+
+def _encode_date_param(value: Any) -> bytes:
+    # what about buffer
+    if not isinstance(value, datetime.date):
+        raise BadInputException(
+            f"expected type=datetime.date but got type={pretty_type(value)} for value={value!r}"
+        )
+    return _PACK_LEN_UINT(4, (value - _DATE_EPOCH).days + _DATE_OFFSET)
+
+
+def _encode_timestamp_param(value: Any) -> bytes:
+    # what about buffer
+    if not isinstance(value, datetime.datetime):
+        raise BadInputException(
+            f"expected type=datetime.date but got type={pretty_type(value)} for value={value!r}"
+        )
+    # count in integer microseconds, unlike the float from timestamp() this
+    # is exact for any datetime, then round half to even to milliseconds
+    if value.tzinfo is None:
+        delta = value - _TIMESTAMP_EPOCH
+    else:
+        delta = value - _TIMESTAMP_EPOCH_UTC
+    micros = (delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds
+    return _PACK_LEN_I64(8, round(micros, -3) // 1000)
+
+
+def _encode_uuid_param(value: Any) -> bytes:
+    # what about buffer
+    if not isinstance(value, uuid.UUID):
+        raise BadInputException(
+            f"expected type=uuid.UUID but got type={pretty_type(value)} for value={value!r}"
+        )
+    return _UUID_LENGTH + value.bytes
+
+
+def _encode_timeuuid_param(value: Any) -> bytes:
+    if isinstance(value, uuid.UUID) and value.version != 1:
+        raise BadInputException(
+            f"value for type={OptionID.TIMEUUID} is not UUID version 1, but version={value.version}"
+        )
+    return _encode_uuid_param(value)
+
+
+def _encode_boolean_param(value: Any) -> bytes:
+    # what about buffer
+    if not isinstance(value, bool):
+        raise BadInputException(
+            f"expected type=bool but got type={pretty_type(value)} for value={value!r}"
+        )
+    return _BOOLEAN_TRUE if value else _BOOLEAN_FALSE
+
+
+def _encode_string_param(value: Any) -> bytes:
+    if not isinstance(value, str):
+        raise BadInputException(
+            f"expected type=str but got type={pretty_type(value)} for value={value!r}"
+        )
+    value_bytes = value.encode("utf-8")
+    return _PACK_INT(len(value_bytes)) + value_bytes
+
+
+def _encode_double_param(value: Any) -> bytes:
+    if not isinstance(value, float):
+        raise BadInputException(
+            f"expected type=float but got type={pretty_type(value)} for value={value!r}"
+        )
+    return _PACK_LEN_DOUBLE(8, value)
+
+
+def _encode_float_param(value: Any) -> bytes:
+    if not isinstance(value, float):
+        raise BadInputException(
+            f"expected type=float but got type={pretty_type(value)} for value={value!r}"
+        )
+    return _PACK_LEN_FLOAT(4, value)
+
+
+def _encode_inet_param(value: Any) -> bytes:
+    if not isinstance(value, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+        raise BadInputException(
+            f"expected type=ipaddress.IPv4Address/ipaddress.IPv6Address but got "
+            + f"type={pretty_type(value)} for value={value!r}"
+        )
+    packed = value.packed
+    return _PACK_INT(len(packed)) + packed
+
+
+def _encode_decimal_param(value: Any) -> bytes:
+    if not isinstance(value, decimal.Decimal):
+        raise BadInputException(
+            f"expected type=decimal.Decimal but got type={pretty_type(value)} for value={value!r}"
+        )
+    sign, digits, exponent = value.as_tuple()
+    # int() parses the digit string in C, rather than a power of ten per digit
+    unscaled_int = int("".join(map(str, digits)))
+    if sign:
+        unscaled_int = -unscaled_int
+    unscaled = encode_varint(unscaled_int)
+    # <length><scale> share one pack, the scale is always an int
+    return _PACK_LEN_INT(4 + len(unscaled), -1 * exponent) + unscaled
+
+
+_PARAM_ENCODERS: Dict[int, Callable[[Any], bytes]] = {
+    OptionID.INT: _int_param_encoder(OptionID.INT, _PACK_LEN_INT, 4),
+    OptionID.TINYINT: _int_param_encoder(OptionID.TINYINT, _PACK_LEN_S8, 1),
+    OptionID.SMALLINT: _int_param_encoder(OptionID.SMALLINT, _PACK_LEN_I16, 2),
+    OptionID.BIGINT: _int_param_encoder(OptionID.BIGINT, _PACK_LEN_I64, 8),
+    OptionID.VARINT: _encode_varint_param,
+    OptionID.BLOB: _encode_blob_param,
+    OptionID.TIME: _encode_time_param,
+    OptionID.DATE: _encode_date_param,
+    OptionID.TIMESTAMP: _encode_timestamp_param,
+    OptionID.TIMEUUID: _encode_timeuuid_param,
+    OptionID.UUID: _encode_uuid_param,
+    OptionID.BOOLEAN: _encode_boolean_param,
+    OptionID.ASCII: _encode_string_param,
+    OptionID.VARCHAR: _encode_string_param,
+    OptionID.DOUBLE: _encode_double_param,
+    OptionID.FLOAT: _encode_float_param,
+    OptionID.INET: _encode_inet_param,
+    OptionID.DECIMAL: _encode_decimal_param,
+}
+
+
 class StartupMessage(RequestMessage):
     opcode = Opcode.STARTUP
 
@@ -600,10 +1093,11 @@ class StartupMessage(RequestMessage):
         assert self.compress is None
 
     def encode_body(self) -> bytes:
-        body = get_struct(f"{NETWORK_ORDER}{STypes.USHORT}").pack(len(self.options))
+        parts = [encode_short(len(self.options))]
         for key, value in self.options.items():
-            body += encode_string(key) + encode_string(value)
-        return body
+            parts.append(encode_string(key))
+            parts.append(encode_string(value))
+        return b"".join(parts)
 
 
 class OptionsMessage(RequestMessage):
@@ -642,7 +1136,7 @@ class ExecuteMessage(RequestMessage):
 
     def encode_body(self) -> bytes:
         # <id>
-        body = encode_string(self.query_id)
+        parts = [encode_string(self.query_id)]
         #   <query_parameters>
         #     <consistency><flags>
         # data check
@@ -650,18 +1144,19 @@ class ExecuteMessage(RequestMessage):
             raise BadInputException(
                 f" count of execute params={len(self.query_params)} doesn't match prepared statement count={len(self.col_specs)}"
             )
-        body += QueryMessage.encode_query_parameters(
-            self.query_params,
-            self.send_metadata,
-            col_specs=self.col_specs,
-            consistency=self.consistency,
-            page_size=self.page_size,
-            paging_state=self.paging_state,
-        )
-
         #     [<n>[name_1]<value_1>...[name_n]<value_n>][<result_page_size>][<paging_state>][<serial_consistency>][<timestamp>]
         # <n>
-        return body
+        parts.extend(
+            QueryMessage.encode_query_parameter_parts(
+                self.query_params,
+                self.send_metadata,
+                col_specs=self.col_specs,
+                consistency=self.consistency,
+                page_size=self.page_size,
+                paging_state=self.paging_state,
+            )
+        )
+        return b"".join(parts)
 
 
 class QueryMessage(RequestMessage):
@@ -688,247 +1183,110 @@ class QueryMessage(RequestMessage):
         self.send_metadata = send_metadata
         super().__init__(*args, **kwargs)
 
+    @staticmethod
+    def encode_prepared_values(
+        query_params: "Collection", col_specs: List[dict]
+    ) -> List[bytes]:
+        # all of the per value work of binding a prepared statement happens here
+        encoders = []
+        for spec in col_specs:
+            option_id = spec["option_id"]
+            try:
+                encoders.append(_PARAM_ENCODERS[option_id])
+            except KeyError:
+                raise InternalDriverError(
+                    f"cannot handle unknown option_id=0x{option_id:x}"
+                )
+        return [encoder(value) for encoder, value in zip(encoders, query_params)]
+
     # used by ExecuteMessage and QueryMessage
     @staticmethod
-    def encode_query_parameters(
+    def encode_query_parameter_parts(
         query_params: "Collection",
         send_metadata: bool,
         consistency: "Consistency",
         col_specs: Optional[List[dict]] = None,
-        page_size: int = None,
-        paging_state: bytes = None,
-    ) -> bytes:
-
-        body: bytes = b""
+        page_size: Optional[int] = None,
+        paging_state: Optional[bytes] = None,
+    ) -> List[bytes]:
+        # the encoded pieces, left for the caller to join with what precedes them
+        parts: List[bytes] = []
         #   <consistency><flags>[<n>[name_1]<value_1>...[name_n]<value_n>][<result_page_size>][<paging_state>][<serial_consistency>][<timestamp>][<keyspace>][<now_in_seconds>]
         flags: int = 0x00
+        # the values are either all named or all positional, decided once here
+        named = isinstance(query_params, dict)
         if len(query_params) > 0:
-            if isinstance(query_params, dict):
-                flags |= QueryFlags.WITH_NAMES_FOR_VALUES
-            flags |= QueryFlags.VALUES
+            if named:
+                flags |= _WITH_NAMES_FOR_VALUES
+            flags |= _VALUES
         if page_size is not None:
-            flags |= QueryFlags.PAGE_SIZE
+            flags |= _PAGE_SIZE
         if paging_state is not None:
-            flags |= QueryFlags.WITH_PAGING_STATE
+            flags |= _WITH_PAGING_STATE
         if not send_metadata:
-            flags |= QueryFlags.SKIP_METADATA
-        body += get_struct(f"{NETWORK_ORDER}{STypes.USHORT}{STypes.BYTE}").pack(
-            consistency, flags
-        )
-        if flags & QueryFlags.VALUES:
-            body += encode_short(len(query_params))
+            flags |= _SKIP_METADATA
+        parts.append(_PACK_CONS_FLAGS(consistency, flags))
+        if flags & _VALUES:
+            parts.append(encode_short(len(query_params)))
             if col_specs is not None:
-                if isinstance(query_params, dict):
+                if named:
                     raise InternalDriverError(
                         "query_params with bind parameters not supported for prepared statement"
                     )
-
-                for value, spec in zip(query_params, col_specs):
-                    if spec["option_id"] in (OptionID.INT,):
-                        if not isinstance(value, int):
-                            raise BadInputException(
-                                f"expected type=int but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}{STypes.INT}", 4, value
-                        )
-                    elif spec["option_id"] in (OptionID.TINYINT,):
-                        if not isinstance(value, int):
-                            raise BadInputException(
-                                f"expected type=int but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}{STypes.BYTE}", 1, value
-                        )
-                    elif spec["option_id"] in (OptionID.SMALLINT,):
-                        if not isinstance(value, int):
-                            raise BadInputException(
-                                f"expected type=int but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}{STypes.SHORT}", 2, value
-                        )
-                    elif spec["option_id"] in (OptionID.BIGINT,):
-                        if not isinstance(value, int):
-                            raise BadInputException(
-                                f"expected type=int but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}{STypes.LONG}", 8, value
-                        )
-                    elif spec["option_id"] in (OptionID.VARINT,):
-                        if not isinstance(value, int):
-                            raise BadInputException(
-                                f"expected type=int but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        res = encode_varint(value)
-                        body += encode_int(len(res)) + res
-                    elif spec["option_id"] in (OptionID.BLOB,):
-                        # what about buffer
-                        if not isinstance(value, bytes) and not isinstance(
-                            value, bytearray
-                        ):
-                            raise BadInputException(
-                                f"expected type=bytes/bytearray but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += encode_bytes(value)
-                    elif spec["option_id"] in (OptionID.TIME,):
-                        # what about buffer
-                        if not isinstance(value, int):
-                            raise BadInputException(
-                                f"expected type=int but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        maxvalue = 60 * 60 * 24 * 10 ** 9 - 1
-                        if value < 0 or value >= maxvalue:
-                            raise BadInputException(
-                                f"value for type={spec['option_id']} is out of range 0 < X < {maxvalue} for value={value!r}"
-                            )
-
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}{STypes.LONG}", 8, value
-                        )
-
-                    elif spec["option_id"] in (OptionID.DATE,):
-                        # what about buffer
-                        if not isinstance(value, datetime.date):
-                            raise BadInputException(
-                                f"expected type=datetime.date but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}{STypes.UINT}",
-                            4,
-                            (
-                                value
-                                - datetime.datetime.fromtimestamp(
-                                    0, datetime.timezone.utc
-                                ).date()
-                            ).days
-                            + 2 ** 31,
-                        )
-                    elif spec["option_id"] in (OptionID.TIMESTAMP,):
-                        # what about buffer
-                        if not isinstance(value, datetime.datetime):
-                            raise BadInputException(
-                                f"expected type=datetime.date but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}{STypes.LONG}",
-                            8,
-                            round(
-                                value.replace(tzinfo=datetime.timezone.utc).timestamp()
-                                * 10 ** 3
-                            ),
-                        )
-                    elif spec["option_id"] in (OptionID.TIMEUUID, OptionID.UUID):
-                        # what about buffer
-                        if not isinstance(value, uuid.UUID):
-                            raise BadInputException(
-                                f"expected type=uuid.UUID but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        if (
-                            spec["option_id"] == OptionID.TIMEUUID
-                            and value.version != 1
-                        ):
-                            raise BadInputException(
-                                f"value for type={spec['option_id']} is not UUID version 1, but version={value.version}"
-                            )
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}", 16
-                        ) + value.int.to_bytes(length=16, byteorder="big")
-
-                    elif spec["option_id"] in (OptionID.BOOLEAN,):
-                        # what about buffer
-                        if not isinstance(value, bool):
-                            raise BadInputException(
-                                f"expected type=bool but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += pack(
-                            f"{NETWORK_ORDER}{STypes.INT}{STypes.BYTE}",
-                            1,
-                            (0, 1)[value],
-                        )
-
-                    elif spec["option_id"] in (OptionID.ASCII, OptionID.VARCHAR):
-                        if not isinstance(value, str):
-                            raise BadInputException(
-                                f"expected type=str but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        body += encode_long_string(value)
-                    elif spec["option_id"] in (OptionID.DOUBLE,):
-                        if not isinstance(value, float):
-                            raise BadInputException(
-                                f"expected type=float but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        encoded = pack(f"{NETWORK_ORDER}{STypes.DOUBLE}", value)
-                        body += encode_int(len(encoded)) + encoded
-                    elif spec["option_id"] in (OptionID.FLOAT,):
-                        if not isinstance(value, float):
-                            raise BadInputException(
-                                f"expected type=float but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        encoded = pack(f"{NETWORK_ORDER}{STypes.FLOAT}", value)
-                        body += encode_int(len(encoded)) + encoded
-
-                    elif spec["option_id"] in (OptionID.INET,):
-                        if not isinstance(
-                            value, ipaddress.IPv4Address
-                        ) and not isinstance(value, ipaddress.IPv6Address):
-                            raise BadInputException(
-                                f"expected type=ipaddress.IPv4Address/ipaddress.IPv6Address but got "
-                                + "type={pretty_type(value)} for value={value!r}"
-                            )
-                        length = (4, 16)[value.version == 6]
-                        body += encode_int(length)
-                        body += int(value).to_bytes(
-                            length, byteorder="big", signed=True
-                        )
-                    elif spec["option_id"] in (OptionID.DECIMAL,):
-                        if not isinstance(value, decimal.Decimal):
-                            raise BadInputException(
-                                f"expected type=decimal.Decimal but got type={pretty_type(value)} for value={value!r}"
-                            )
-                        scale = encode_int(-1 * value.as_tuple().exponent)
-                        unscaled = encode_varint(
-                            sum(
-                                10 ** c * d
-                                for c, d in enumerate(reversed(value.as_tuple().digits))
-                            )
-                        )
-                        body += encode_int(len(scale + unscaled)) + scale + unscaled
-                    else:
-                        raise InternalDriverError(
-                            f"cannot handle unknown option_id=0x{spec['option_id']:x}"
-                        )
+                parts.extend(
+                    QueryMessage.encode_prepared_values(query_params, col_specs)
+                )
+            elif named:
+                assert isinstance(query_params, dict)
+                # [name_n]<value_n>
+                for key, value in query_params.items():
+                    parts.append(encode_string(key))
+                    parts.append(encode_value(value))
             else:
-                if isinstance(query_params, dict):
-                    # [name_n]<value_n>
-                    for key, value in query_params.items():
-                        body += encode_string(key) + encode_value(value)
-                else:
-                    # <value_n>
-                    for value in query_params:
-                        body += encode_value(value)
-        if flags & QueryFlags.PAGE_SIZE:
+                # <value_n>
+                parts.extend([encode_value(value) for value in query_params])
+        if flags & _PAGE_SIZE:
             assert page_size is not None
-            body += encode_int(page_size)
-        if flags & QueryFlags.WITH_PAGING_STATE:
+            parts.append(encode_int(page_size))
+        if flags & _WITH_PAGING_STATE:
             assert paging_state is not None
-            body += encode_bytes(paging_state)
-        logger.debug(
-            f"lets' see the body={body!r} query_params={query_params} flags={flags}"
+            parts.append(encode_bytes(paging_state))
+        logger.debug("query_params=%s flags=%s", query_params, flags)
+        return parts
+
+    @staticmethod
+    def encode_query_parameters(
+        query_params: "Collection",
+        send_metadata: bool,
+        consistency: "Consistency",
+        col_specs: Optional[List[dict]] = None,
+        page_size: Optional[int] = None,
+        paging_state: Optional[bytes] = None,
+    ) -> bytes:
+        return b"".join(
+            QueryMessage.encode_query_parameter_parts(
+                query_params,
+                send_metadata,
+                consistency,
+                col_specs=col_specs,
+                page_size=page_size,
+                paging_state=paging_state,
+            )
         )
-        return body
 
     def encode_body(self) -> bytes:
-        body = encode_long_string(self.query)
-        body += QueryMessage.encode_query_parameters(
-            self.query_params,
-            self.send_metadata,
-            consistency=self.consistency,
-            page_size=self.page_size,
-            paging_state=self.paging_state,
+        # one join sizes the body once, instead of growing a buffer per value
+        parts = [encode_long_string(self.query)]
+        parts.extend(
+            QueryMessage.encode_query_parameter_parts(
+                self.query_params,
+                self.send_metadata,
+                consistency=self.consistency,
+                page_size=self.page_size,
+                paging_state=self.paging_state,
+            )
         )
-        return body
+        return b"".join(parts)
 
 
 class RegisterMessage(RequestMessage):
@@ -936,18 +1294,26 @@ class RegisterMessage(RequestMessage):
 
     def __init__(self, events: List[Events], *args: Any, **kwargs: Any) -> None:
         self.events = events
+        # events don't change after construction, so only check them once
+        try:
+            unknown = not _EVENT_NAMES.issuperset(events)
+        except TypeError:
+            # an unhashable event can't be a name, find it below
+            unknown = True
+        if unknown:
+            for event in events:
+                if not isinstance(event, str) or event not in _EVENT_NAMES:
+                    raise TypeViolation(
+                        f"got unknown event={event}. please use pysandra.Events"
+                    )
+        self._body: Optional[bytes] = None
         super().__init__(*args, **kwargs)
 
     def encode_body(self) -> bytes:
-        checked: List[str] = []
-        for event in self.events:
-            try:
-                checked.append(Events(event))
-            except ValueError:
-                raise TypeViolation(
-                    f"got unknown event={event}. please use pysandra.Events"
-                )
-        return encode_strings_list(checked)
+        # the body only depends on the constructor arguments
+        if self._body is None:
+            self._body = encode_strings_list(self.events)
+        return self._body
 
 
 class PrepareMessage(RequestMessage):
@@ -955,7 +1321,11 @@ class PrepareMessage(RequestMessage):
 
     def __init__(self, query: str, *args: Any, **kwargs: Any) -> None:
         self.query = query
+        self._body: Optional[bytes] = None
         super().__init__(*args, **kwargs)
 
     def encode_body(self) -> bytes:
-        return encode_long_string(self.query)
+        # the body only depends on the constructor arguments
+        if self._body is None:
+            self._body = encode_long_string(self.query)
+        return self._body
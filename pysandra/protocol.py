@@ -1,6 +1,7 @@
+from struct import Struct
 from typing import Callable, Optional, Tuple
 
-from .codecs import NETWORK_ORDER, STypes, get_struct
+from .codecs import NETWORK_ORDER, STypes
 from .constants import SERVER_SENT
 from .exceptions import InternalDriverError, VersionMismatchException
 from .messages import (
@@ -19,6 +20,10 @@ from .utils import get_logger
 logger = get_logger(__name__)
 
 
+_UNPACK_HEADER = Struct(
+    f"{NETWORK_ORDER}{STypes.BYTE.value}{STypes.BYTE.value}{STypes.SHORT.value}{STypes.BYTE.value}{STypes.INT.value}"
+).unpack
+
 # Header = namedtuple('Header', 'version flags stream_id opcode')
 
 
@@ -30,11 +35,15 @@ class Protocol:
         self.server_role = server_role
 
     def decode_header(self, header: bytes) -> Tuple[int, int, int, int, int]:
-        version, flags, stream, opcode, length = get_struct(
-            f"{NETWORK_ORDER}{STypes.BYTE}{STypes.BYTE}{STypes.SHORT}{STypes.BYTE}{STypes.INT}"
-        ).unpack(header)
+        version, flags, stream, opcode, length = _UNPACK_HEADER(header)
         logger.debug(
-            f"got head={header!r} containing version={version:x} flags={flags:x} stream={stream:x} opcode={opcode:x} length={length:x}"
+            "got head=%r containing version=%x flags=%x stream=%x opcode=%x length=%x",
+            header,
+            version,
+            flags,
+            stream,
+            opcode,
+            length,
         )
         self._check_version(version)
         return version, flags, stream, opcode, length
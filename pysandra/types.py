@@ -8,6 +8,7 @@ from typing import (  # noqa
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     NamedTuple,
@@ -164,6 +165,10 @@ class Row:
 class Rows:
     """
     This is the container for data queried from cassandra
+
+    Rows are stored as the plain tuples they were decoded into, and only
+    wrapped in a Row when they are read back. Each read builds a new Row,
+    so code that reads the same row many times should keep a reference.
     """
 
     def __init__(self, col_specs: Optional[List[Dict[str, Any]]] = None) -> None:
@@ -177,8 +182,18 @@ class Rows:
     def __iter__(self) -> "Rows":
         return self
 
-    def __getitem__(self, index: int) -> Union["Row", Tuple["ExpectedType", ...]]:
-        return self._data[index]
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[
+        "Row",
+        Tuple["ExpectedType", ...],
+        List[Union["Row", Tuple["ExpectedType", ...]]],
+    ]:
+        # not cached, a Row per stored tuple would undo the savings of
+        # decoding into tuples for results that are only read once
+        if isinstance(index, slice):
+            return [self._row(row) for row in self._data[index]]
+        return self._row(self._data[index])
 
     def __len__(self) -> int:
         return len(self._data)
@@ -191,19 +206,19 @@ class Rows:
     def col_specs(self, col_specs: List[Dict[str, Any]]) -> None:
         self._col_specs = col_specs
         self._fields = [col["name"] for col in col_specs]
-        if len(self._data) > 0:
-            rows = []
-            for row in self._data:
-                rows.append(Row(*row, fields_=self._fields))
-            self._data.clear()
-            for row in rows:
-                self._data.append(row)
 
-    def add_row(self, row: Tuple["ExpectedType", ...]) -> None:
+    def _row(
+        self, row: Union["Row", Tuple["ExpectedType", ...]]
+    ) -> Union["Row", Tuple["ExpectedType", ...]]:
         if self._fields is not None:
-            self._data.append(Row(*row, fields_=self._fields))
-        else:
-            self._data.append(row)
+            return Row(*row, fields_=self._fields)
+        return row
+
+    def add_row(self, row: Tuple["ExpectedType", ...]) -> None:
+        self._data.append(row)
+
+    def add_rows(self, rows: Iterable[Tuple["ExpectedType", ...]]) -> None:
+        self._data.extend(rows)
 
     def __next__(self) -> Union["Row", Tuple["ExpectedType", ...]]:
         if self.index == len(self._data):
@@ -212,7 +227,7 @@ class Rows:
             raise StopIteration
         current = self._data[self.index]
         self.index += 1
-        return current
+        return self._row(current)
 
 
 class PagingRows(Rows):
@@ -225,7 +240,7 @@ class PagingRows(Rows):
         return self
 
     async def _extend(self) -> None:
-        logger.debug(f"extend has page_={self.page_}")
+        logger.debug("extend has page_=%s", self.page_)
         if self.page_ is None:
             return
         resp = await self.page_(self.paging_state)
@@ -234,8 +249,8 @@ class PagingRows(Rows):
             self.paging_state = resp.paging_state
         else:
             self.page_ = None
-        for row in resp:
-            self.add_row(row)
+        # take the stored tuples, iterating resp would hand back wrapped rows
+        self.add_rows(resp._data)
 
     async def __anext__(self) -> Union["Row", Tuple["ExpectedType", ...]]:
         if self.index == len(self._data):
@@ -246,4 +261,4 @@ class PagingRows(Rows):
             raise StopAsyncIteration
         current = self._data[self.index]
         self.index += 1
-        return current
+        return self._row(current)
@@ -17,7 +17,9 @@ def fetch_module(name: str) -> Optional[ModuleType]:
 
 class PKZip:
     def __init__(self) -> None:
-        packer = Struct("!l").pack
+        length = Struct("!l")
+        packer = length.pack
+        unpacker = length.unpack_from
         supported = {}
         snappy: Any = fetch_module("snappy")
         if snappy is not None:
@@ -29,11 +31,13 @@ class PKZip:
             assert hasattr(lz4_block, "compress")
             assert hasattr(lz4_block, "decompress")
             # Cassandra writes the uncompressed message length in big endian order,
-            # but the lz4 lib requires little endian order, so we wrap these
-            # functions to handle that
+            # but the lz4 lib uses little endian order, so we handle the length
+            # ourselves rather than copying the block to swap it
             supported["lz4"] = (
-                lambda x: packer(len(x)) + lz4_block.compress(x)[4:],
-                lambda x: lz4_block.decompress(x[3::-1] + x[4:]),
+                lambda x: packer(len(x)) + lz4_block.compress(x, store_size=False),
+                lambda x: lz4_block.decompress(
+                    memoryview(x)[4:], uncompressed_size=unpacker(x)[0]
+                ),
             )
         self._supported = supported
 
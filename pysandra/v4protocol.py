@@ -2,7 +2,7 @@ from asyncio import Queue, QueueFull
 from typing import Any, Callable, Dict, Optional, Type
 
 from .constants import EVENTS_QUEUE_MAXSIZE, Opcode
-from .core import SBytes
+from .core import SBytes, value_map
 from .exceptions import ServerError  # noqa: F401
 from .exceptions import InternalDriverError, UnknownPayloadException
 from .messages import (
@@ -31,6 +31,14 @@ from .utils import get_logger
 
 logger = get_logger(__name__)
 
+_OPCODES = value_map(Opcode)
+_RESPONSE_FACTORIES: Dict[int, Type["ResponseMessage"]] = {
+    Opcode.ERROR: ErrorMessage,
+    Opcode.READY: ReadyMessage,
+    Opcode.SUPPORTED: SupportedMessage,
+    Opcode.RESULT: ResultMessage,
+}
+
 
 class V4Protocol(Protocol):
     version = 0x04
@@ -58,7 +66,7 @@ class V4Protocol(Protocol):
 
     def query(self, stream_id: int, params: dict) -> "QueryMessage":
         assert params is not None
-        logger.debug(f"params is {params}")
+        logger.debug("params is %s", params)
         return QueryMessage(
             params["query"],
             params["query_params"],
@@ -95,7 +103,10 @@ class V4Protocol(Protocol):
             )
         prepared = self._prepared[statement_id]
         logger.debug(
-            f"have prepared col_specs={prepared.col_specs} statement_id={statement_id} and params={params}"
+            "have prepared col_specs=%s statement_id=%s and params=%s",
+            prepared.col_specs,
+            statement_id,
+            params,
         )
         return ExecuteMessage(
             statement_id,
@@ -142,30 +153,14 @@ class V4Protocol(Protocol):
     ) -> "ExpectedResponses":
         sbytes_body = SBytes(body)
         response: Optional["ResponseMessage"] = None
-        factory: Optional[Type["ResponseMessage"]] = None
-        try:
-            opcode = Opcode(opcode_int)
-        except ValueError:
+        opcode = _OPCODES.get(opcode_int)
+        if opcode is None:
             raise InternalDriverError(f"unknown optcode={opcode_int}")
-        if opcode == Opcode.ERROR:
-            factory = ErrorMessage
-        elif opcode == Opcode.READY:
-            factory = ReadyMessage
-        elif opcode == Opcode.AUTHENTICATE:
-            pass
-        elif opcode == Opcode.SUPPORTED:
-            factory = SupportedMessage
-        elif opcode == Opcode.RESULT:
-            factory = ResultMessage
-        elif opcode == Opcode.EVENT:
-            pass
-        elif opcode == Opcode.AUTH_CHALLENGE:
-            pass
-        elif opcode == Opcode.AUTH_SUCCESS:
-            pass
+        # AUTHENTICATE, AUTH_CHALLENGE, AUTH_SUCCESS and EVENT have no factory
+        factory = _RESPONSE_FACTORIES.get(opcode)
         if factory is None:
             raise UnknownPayloadException(f"unhandled message opcode={opcode!r}")
-        logger.debug(f"calling create on factory={factory}")
+        logger.debug("calling create on factory=%s", factory)
         response = factory.create(version, flags, stream_id, sbytes_body)
         # error can happen any time
         if opcode == Opcode.ERROR:
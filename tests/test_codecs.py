@@ -5,7 +5,7 @@ import pytest
 from pysandra import codecs
 from pysandra.constants import Consistency
 from pysandra.core import SBytes
-from pysandra.exceptions import InternalDriverError
+from pysandra.exceptions import BadInputException, InternalDriverError
 from pysandra.types import InetType
 
 
@@ -49,6 +49,15 @@ def test_codecs_encode_value_bytes():
     assert codecs.encode_value(body) == b"\x00\x00\x00\x04asdf"
 
 
+def test_codecs_encode_value_bool():
+    assert codecs.encode_value(True) == b"\x00\x00\x00\x04\x00\x00\x00\x01"
+
+
+def test_codecs_encode_value_bad_type():
+    with pytest.raises(BadInputException, match=r"expected type=int/str/bytes"):
+        codecs.encode_value(1.5)
+
+
 def test_codecs_encode_value_none():
     body = None
     assert codecs.encode_value(body) == b"\xff\xff\xff\xff"
@@ -132,6 +141,18 @@ def test_codecs_decode_int_bytes_ipv4():
     assert codecs.decode_inet(body) == InetType(ipaddress.IPv4Address("9.9.9.9"), 443)
 
 
+def test_codecs_decode_int_bytes_ipv4_order():
+    body = SBytes(b"\x04\x0a\x00\x00\x01\x00\x00\x23\x52")
+    assert codecs.decode_inet(body) == InetType(ipaddress.IPv4Address("10.0.0.1"), 9042)
+
+
+def test_codecs_decode_int_bytes_ipv6():
+    body = SBytes(b"\x10\x20\x01\x0d\xb8" + b"\x00" * 11 + b"\x01\x00\x00\x23\x52")
+    assert codecs.decode_inet(body) == InetType(
+        ipaddress.IPv6Address("2001:db8::1"), 9042
+    )
+
+
 def test_codecs_decode_int_bytes_invalid():
     with pytest.raises(InternalDriverError, match=r"unhandled inet length=5"):
         body = SBytes(b"\x05\x09\x09\x09\x09\x00\x00\x01\xBB")
@@ -182,3 +203,15 @@ def test_codecs_decode_length_bytes_zero():
     body = SBytes(b"\x01\x02\x03\x04")
     value = codecs.decode_length_bytes(body, 0)
     assert value == b"" and body.remaining == b"\x01\x02\x03\x04"
+
+
+def test_codecs_encode_value_buffers():
+    expected = b"\x00\x00\x00\x04\x00\x01\x00\x02"
+    assert codecs.encode_value(bytearray(b"\x00\x01\x00\x02")) == expected
+    assert codecs.encode_value(memoryview(b"\x00\x01\x00\x02")) == expected
+    assert codecs.encode_value(memoryview(b"\x00\x01\x00\x02").cast("H")) == expected
+
+
+def test_codecs_encode_value_memoryview_noncontiguous():
+    with pytest.raises(BadInputException, match=r"expected a contiguous memoryview"):
+        codecs.encode_value(memoryview(b"\x00\x01\x00\x02")[::2])
@@ -1,6 +1,8 @@
+from struct import Struct
+
 import pytest
 
-from pysandra.core import HexEnum, SBytes, Streams, pretty_type
+from pysandra.core import HexEnum, SBytes, Streams, pretty_type, value_map
 from pysandra.exceptions import InternalDriverError, MaximumStreamsException
 
 
@@ -28,6 +30,15 @@ def test_hexenum_repr():
     assert repr(foo) == "<Foo.BAR: 0x10>"
 
 
+def test_value_map():
+    class Foo(HexEnum):
+        BAR = 0x10
+        BAZ = 0x20
+
+    assert value_map(Foo) == {0x10: Foo.BAR, 0x20: Foo.BAZ}
+    assert value_map(Foo)[0x20] is Foo.BAZ
+
+
 def test_pretty_type_int():
     assert pretty_type(1) == "int"
 
@@ -119,9 +130,34 @@ def test_sbytes_not_end():
     assert not t.at_end()
 
 
+def test_sbytes_unpack():
+    t = SBytes(b"\x00\x01\x00\x00\x00\x02%")
+    assert t.unpack(Struct("!Hl")) == (1, 2)
+    assert t.remaining == b"%"
+
+
+def test_sbytes_unpack_overflow():
+    with pytest.raises(InternalDriverError, match=r"cannot go beyond"):
+        t = SBytes(b"\x00\x01\x00")
+        t.unpack(Struct("!Hl"))
+
+
 def test_sbytes_overflow():
     with pytest.raises(InternalDriverError, match=r"cannot go beyond"):
         t = SBytes(b"12345")
         t.grab(1)
         t.grab(3)
         t.grab(2)
+
+
+def test_sbytes_skip():
+    t = SBytes(b"\x03\13\45")
+    t.skip(2)
+    assert t.position == 2
+    assert t.remaining == b"%"
+
+
+def test_sbytes_skip_overflow():
+    with pytest.raises(InternalDriverError, match=r"cannot go beyond"):
+        t = SBytes(b"12345")
+        t.skip(6)
@@ -2,6 +2,7 @@ import datetime
 import decimal
 import ipaddress
 import uuid
+from struct import error as StructError
 
 import pytest
 
@@ -127,6 +128,71 @@ def test_messages_errormsg_build_unavailable():
     assert msg.error_code == constants.ErrorCode.UNAVAILABLE_EXCEPTION
 
 
+def test_messages_errormsg_build_write_timeout():
+    body = (
+        b"\x00\x00\x11\x00\x00\x07timeout\x00\x01\x00\x00\x00\x01\x00\x00\x00\x02"
+        + b"\x00\x06SIMPLE"
+    )
+    msg = messages.ErrorMessage.build(1, 2, 3, SBytes(body),)
+    assert msg.details == {
+        "consistency_level": Consistency.ONE,
+        "received": 1,
+        "block_for": 2,
+        "write_type": constants.WriteType.SIMPLE,
+    }
+
+
+def test_messages_errormsg_build_read_failure():
+    body = (
+        b"\x00\x00\x13\x00\x00\x04fail\x00\x04\x00\x00\x00\x01\x00\x00\x00\x02"
+        + b"\x00\x00\x00\x01\x01"
+    )
+    msg = messages.ErrorMessage.build(1, 2, 3, SBytes(body),)
+    assert msg.details == {
+        "consistency_level": Consistency.QUORUM,
+        "received": 1,
+        "block_for": 2,
+        "num_failures": 1,
+        "data_present": 1,
+    }
+
+
+def test_messages_errormsg_build_write_failure():
+    body = (
+        b"\x00\x00\x15\x00\x00\x04fail\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01"
+        + b"\x00\x00\x00\x01\x00\x05BATCH"
+    )
+    msg = messages.ErrorMessage.build(1, 2, 3, SBytes(body),)
+    assert msg.details == {
+        "consistency_level": Consistency.ONE,
+        "received": 0,
+        "block_for": 1,
+        "num_failures": 1,
+        "write_type": constants.WriteType.BATCH,
+    }
+
+
+def test_messages_errormsg_build_bad_consistency():
+    body = b"\x00\x00\x10\x00\x00\x04fail\x00\xff\x00\x00\x00\x03\x00\x00\x00\x01"
+    with pytest.raises(exceptions.InternalDriverError, match=r"unknown consistency=ff"):
+        messages.ErrorMessage.build(
+            1, 2, 3, SBytes(body),
+        )
+
+
+def test_messages_errormsg_build_bad_write_type():
+    body = (
+        b"\x00\x00\x11\x00\x00\x07timeout\x00\x01\x00\x00\x00\x01\x00\x00\x00\x02"
+        + b"\x00\x06SIMPLY"
+    )
+    with pytest.raises(
+        exceptions.InternalDriverError, match=r"unknown write_type=SIMPLY"
+    ):
+        messages.ErrorMessage.build(
+            1, 2, 3, SBytes(body),
+        )
+
+
 def test_messages_event_build_good():
     body = b"\x00\rSCHEMA_CHANGE\x00\x07CREATED\x00\x08KEYSPACE\x00\x0ctestkeyspace"
     msg = messages.EventMessage.build(1, 2, 3, SBytes(body),)
@@ -190,6 +256,7 @@ def test_messages_preparedresults_meta():
         + b"\t\x00\tuser_name\x00\r\x00\nuser_bcity\x00\r\x00\x00\x00\x04\x00\x00\x00\x00"
     )
     msg = messages.ResultMessage.build(1, 2, 3, SBytes(body),)
+    assert msg.pk_index == [0]
     assert msg.col_specs == [
         {"ksname": "uprofile", "name": "user_id", "option_id": 9, "tablename": "user"},
         {
@@ -260,6 +327,13 @@ def test_messages_voidresults():
     assert isinstance(msg, messages.VoidResultMessage)
 
 
+def test_messages_result_unknown_kind():
+    with pytest.raises(
+        exceptions.UnknownPayloadException, match=r"RESULT message has unknown kind=9"
+    ):
+        messages.ResultMessage.build(1, 2, 3, SBytes(b"\x00\x00\x00\x09"))
+
+
 def test_messages_setkeyspaceresult():
     body = b"\x00\x00\x00\x03\x00\x08uprofile"
     msg = messages.ResultMessage.build(1, 2, 3, SBytes(body),)
@@ -271,8 +345,15 @@ def test_messages_register_bad():
         exceptions.TypeViolation,
         match=r"unknown event=asdf. please use pysandra.Events",
     ):
-        msg = messages.RegisterMessage(["asdf"], 1, 1, 1)
-        msg.encode_body()
+        messages.RegisterMessage(["asdf"], 1, 1, 1)
+
+
+def test_messages_register_unhashable():
+    with pytest.raises(
+        exceptions.TypeViolation,
+        match=r"unknown event=\[\]. please use pysandra.Events",
+    ):
+        messages.RegisterMessage([Events.STATUS_CHANGE, []], 1, 1, 1)
 
 
 def test_messages_rowresults_alltypes():
@@ -478,3 +559,182 @@ def test_messages_execute_alltypes():
         0,
     )
     assert msg.encode_body() == expected_body
+
+
+def test_messages_rowresults_fixed_width():
+    body = (
+        b"\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\x00\x02ks\x00\x01t"
+        + b"\x00\x01a\x00\t\x00\x01b\x00\x02\x00\x01c\x00\x07\x00\x00\x00\x02"
+        + b"\x00\x00\x00\x04\xff\xff\xff\xfe\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x03"
+        + b"\x00\x00\x00\x08?\xf8\x00\x00\x00\x00\x00\x00"
+        + b"\x00\x00\x00\x04\x00\x00\x00\x05\x00\x00\x00\x08\xff\xff\xff\xff\xff\xff\xff\xff"
+        + b"\x00\x00\x00\x08\xc0\x04\x00\x00\x00\x00\x00\x00"
+    )
+    msg = messages.ResultMessage.create(1, 2, 3, SBytes(body))
+    assert list(msg.rows) == [Row(a=-2, b=3, c=1.5), Row(a=5, b=-1, c=-2.5)]
+
+
+def test_messages_rowresults_fixed_width_fallback():
+    body = (
+        b"\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x02ks\x00\x01t"
+        + b"\x00\x01a\x00\x02\x00\x00\x00\x02"
+        + b"\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00"
+    )
+    msg = messages.ResultMessage.create(1, 2, 3, SBytes(body))
+    assert list(msg.rows) == [Row(a=3), Row(a=0)]
+
+
+def test_messages_rowresults_null_cell():
+    body = (
+        b"\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\x00\x02ks\x00\x01t"
+        + b"\x00\x01a\x00\x02\x00\x01b\x00\x0d\x00\x00\x00\x01"
+        + b"\xff\xff\xff\xff\x00\x00\x00\x02hi"
+    )
+    msg = messages.ResultMessage.create(1, 2, 3, SBytes(body))
+    assert list(msg.rows) == [Row(a=None, b="hi")]
+
+
+def test_messages_rowresults_truncated():
+    body = (
+        b"\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x02ks\x00\x01t"
+        + b"\x00\x01b\x00\x0d\x00\x00\x00\x01\x00\x00\x00\x05hi"
+    )
+    with pytest.raises(exceptions.InternalDriverError, match=r"cannot go beyond"):
+        messages.ResultMessage.create(1, 2, 3, SBytes(body))
+
+
+def test_messages_rowresults_truncated_length():
+    body = (
+        b"\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x02ks\x00\x01t"
+        + b"\x00\x01b\x00\x0d\x00\x00\x00\x01\x00\x00"
+    )
+    with pytest.raises(exceptions.InternalDriverError, match=r"cannot go beyond"):
+        messages.ResultMessage.create(1, 2, 3, SBytes(body))
+
+
+def test_messages_rowresults_bad_fixed_cell():
+    # a 4 byte DOUBLE cell is a bad value, not a short body
+    body = (
+        b"\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x02ks\x00\x01t"
+        + b"\x00\x01c\x00\x07\x00\x00\x00\x01\x00\x00\x00\x04\x00\x00\x00\x00"
+    )
+    with pytest.raises(StructError, match=r"requires a buffer of 8 bytes"):
+        messages.ResultMessage.create(1, 2, 3, SBytes(body))
+
+
+def test_messages_rowresults_unhandled_option_id():
+    body = (
+        b"\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x02ks\x00\x01t"
+        + b"\x00\x01a\x00\x20\x00\x0d\x00\x00\x00\x00"
+    )
+    with pytest.raises(exceptions.InternalDriverError, match=r"unhandled option_id=32"):
+        messages.ResultMessage.create(1, 2, 3, SBytes(body))
+
+
+def test_messages_query_params_negative_decimal():
+    body = messages.QueryMessage.encode_query_parameters(
+        [decimal.Decimal("-1.5")], False, Consistency.ONE, col_specs=[{"option_id": 6}]
+    )
+    assert body == b"\x00\x01\x03\x00\x01\x00\x00\x00\x05\x00\x00\x00\x01\xf1"
+
+
+def test_messages_query_params_inet_high_bit():
+    body = messages.QueryMessage.encode_query_parameters(
+        [ipaddress.IPv6Address("ff02::1")],
+        False,
+        Consistency.ONE,
+        col_specs=[{"option_id": 16}],
+    )
+    assert (
+        body == b"\x00\x01\x03\x00\x01\x00\x00\x00\x10\xff\x02" + b"\x00" * 13 + b"\x01"
+    )
+
+
+def test_messages_query_params_time_range():
+    with pytest.raises(exceptions.BadInputException, match=r"out of range"):
+        messages.QueryMessage.encode_query_parameters(
+            [-1], False, Consistency.ONE, col_specs=[{"option_id": 18}]
+        )
+
+
+def test_messages_query_params_tinyint_signed():
+    body = messages.QueryMessage.encode_query_parameters(
+        [-1], False, Consistency.ONE, col_specs=[{"option_id": 20}]
+    )
+    assert body == b"\x00\x01\x03\x00\x01\x00\x00\x00\x01\xff"
+
+
+def test_messages_query_params_int_range():
+    with pytest.raises(exceptions.BadInputException, match=r"out of range"):
+        messages.QueryMessage.encode_query_parameters(
+            [2 ** 31], False, Consistency.ONE, col_specs=[{"option_id": 9}]
+        )
+
+
+def test_messages_query_params_int_type():
+    with pytest.raises(exceptions.BadInputException, match=r"expected type=int"):
+        messages.QueryMessage.encode_query_parameters(
+            ["1"], False, Consistency.ONE, col_specs=[{"option_id": 9}]
+        )
+
+
+def test_messages_query_params_timestamp_aware():
+    tz = datetime.timezone(datetime.timedelta(hours=-5))
+    body = messages.QueryMessage.encode_query_parameters(
+        [
+            datetime.datetime(2019, 11, 29, 12, 41, 14, 139000, tzinfo=tz),
+            datetime.datetime(2019, 11, 29, 17, 41, 14, 139000),
+        ],
+        False,
+        Consistency.ONE,
+        col_specs=[{"option_id": 11}, {"option_id": 11}],
+    )
+    assert body == b"\x00\x01\x03\x00\x02" + 2 * (
+        b"\x00\x00\x00\x08\x00\x00\x01n\xb8@\xa3\x1b"
+    )
+
+
+def test_messages_prepare_body_cached():
+    msg = messages.PrepareMessage("select 1", 1, 2, 3)
+    assert msg.encode_body() == b"\x00\x00\x00\x08select 1"
+    assert msg.encode_body() is msg.encode_body()
+
+
+def test_messages_query_params_timestamp_rounding():
+    # 1.5ms and 2.5ms are both ties, which round to the even millisecond
+    values = [
+        datetime.datetime(1970, 1, 1, 0, 0, 0, 1500),
+        datetime.datetime(1970, 1, 1, 0, 0, 0, 2500),
+        datetime.datetime(9999, 12, 31, 23, 59, 59, 999999),
+    ]
+    body = messages.QueryMessage.encode_query_parameters(
+        values, False, Consistency.ONE, col_specs=[{"option_id": 0x0B}] * 3,
+    )
+    assert body[-36:] == (
+        b"\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x02"
+        + b"\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x02"
+        + b"\x00\x00\x00\x08"
+        + (253402300800000).to_bytes(8, "big")
+    )
+
+
+def test_messages_query_params_blob_memoryview():
+    body = messages.QueryMessage.encode_query_parameters(
+        [memoryview(b"\x00\x01\x00\x02").cast("H")],
+        False,
+        Consistency.ONE,
+        col_specs=[{"option_id": 3}],
+    )
+    assert body == b"\x00\x01\x03\x00\x01\x00\x00\x00\x04\x00\x01\x00\x02"
+
+
+def test_messages_query_params_blob_memoryview_noncontiguous():
+    with pytest.raises(
+        exceptions.BadInputException, match=r"expected a contiguous memoryview"
+    ):
+        messages.QueryMessage.encode_query_parameters(
+            [memoryview(b"\x00\x01\x00\x02")[::2]],
+            False,
+            Consistency.ONE,
+            col_specs=[{"option_id": 3}],
+        )
@@ -67,6 +67,28 @@ def test_types_rows_specs_a4():
     assert list(d)[0].two == b"2"
 
 
+def test_types_rows_add_rows():
+    d = types.Rows(col_specs=[{"name": "one"}, {"name": "two"}])
+    d.add_rows([(b"1", b"2"), (b"3", b"4")])
+    assert len(d) == 2
+    assert d[1] == types.Row(one=b"3", two=b"4")
+
+
+def test_types_rows_slice():
+    d = types.Rows(col_specs=[{"name": "one"}, {"name": "two"}])
+    d.add_rows([(b"1", b"2"), (b"3", b"4"), (b"5", b"6")])
+    assert d[0:2] == [
+        types.Row(one=b"1", two=b"2"),
+        types.Row(one=b"3", two=b"4"),
+    ]
+
+
+def test_types_rows_slice_nospecs():
+    d = types.Rows()
+    d.add_rows([(b"1", b"2"), (b"3", b"4")])
+    assert d[1:] == [(b"3", b"4")]
+
+
 def test_types_rows_specs_len():
     d = types.Rows()
     d.add_row((b"1", b"2"))
@@ -135,6 +157,34 @@ async def test_types_pagingrow_bigasynciter():
     assert len(rows) == 6
 
 
+@pytest.mark.asyncio
+async def test_types_pagingrow_bigasynciter_specs():
+    specs = [{"name": "one"}, {"name": "two"}]
+
+    async def extend(state):
+        if state == b"1":
+            h = types.PagingRows(col_specs=specs, paging_state=b"2")
+            h.add_row((b"1", b"2"))
+            h.add_row((b"3", b"4"))
+            return h
+
+        g = types.Rows(col_specs=specs)
+        g.add_row((b"5", b"6"))
+        g.add_row((b"7", b"8"))
+        return g
+
+    d = types.PagingRows(col_specs=specs, paging_state=b"1")
+    d.page_ = extend
+    d.add_row((b"1", b"2"))
+    d.add_row((b"3", b"4"))
+    rows = []
+    async for row in d:
+        rows.append(row)
+    assert len(rows) == 6
+    assert rows[5] == types.Row(one=b"7", two=b"8")
+    assert d._data[5] == (b"7", b"8")
+
+
 def test_types_row_specs_dict():
     d = types.Row(1, 2, 3, fields_=["a", "b", "c"])
     assert dict(d.asdict_()) == {"a": 1, "b": 2, "c": 3}
@@ -50,6 +50,15 @@ def test_pkzip_lz4_data(pkzip):
     )
 
 
+def test_pkzip_lz4_roundtrip(pkzip):
+    pytest.importorskip("lz4.block")
+    # long enough that a little endian length would not read the same
+    data = bytes(range(256)) + b"pysandra" * 8
+    cdata = pkzip.compress(data, "lz4")
+    assert cdata[:4] == b"\x00\x00\x01\x40"
+    assert pkzip.decompress(cdata, "lz4") == data
+
+
 def test_pkzip_emtpty_lz4(pkzip):
     data = b""
     algo = "lz4"
@@ -1,8 +1,13 @@
 import pytest
 
 from pysandra.constants import Consistency, Opcode
-from pysandra.exceptions import InternalDriverError
-from pysandra.messages import PreparedResultMessage, PrepareMessage
+from pysandra.exceptions import InternalDriverError, UnknownPayloadException
+from pysandra.messages import (
+    OptionsMessage,
+    PreparedResultMessage,
+    PrepareMessage,
+    StartupMessage,
+)
 from pysandra.v4protocol import V4Protocol
 
 
@@ -71,3 +76,20 @@ def test_v4protocol_query():
         "consistency": Consistency.ONE,
     }
     assert v4.query(1, params).opcode == Opcode.QUERY
+
+
+def test_v4protocol_decode_bad_opcode():
+    v4 = V4Protocol()
+    with pytest.raises(InternalDriverError, match=r"unknown optcode=255"):
+        v4.build_response(OptionsMessage(0, 0, 0), 4, 0, 0, 0xFF, 0, b"")
+
+
+def test_v4protocol_decode_ready():
+    v4 = V4Protocol()
+    assert v4.build_response(StartupMessage({}, 0, 0, 0), 4, 0, 0, Opcode.READY, 0, b"")
+
+
+def test_v4protocol_decode_unhandled_opcode():
+    v4 = V4Protocol()
+    with pytest.raises(UnknownPayloadException, match=r"unhandled message opcode"):
+        v4.build_response(OptionsMessage(0, 0, 0), 4, 0, 0, Opcode.AUTHENTICATE, 0, b"")